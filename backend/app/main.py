@@ -11,6 +11,7 @@ from loguru import logger
 import json
 import asyncio
 import httpx
+from urllib.parse import urlsplit
 
 from app.settings import settings
 from app.utils.logger import setup_logging
@@ -19,9 +20,11 @@ from app.services.llm_router import llm_router
 from app.services.config_manager import config_manager
 from app.services.event_extractor import event_extractor
 from app.services.search_service import search_service
+from app.services.scraper_manager import scraper_manager
 from app.services.excel_exporter import excel_exporter
 from app.services.social_search_service import social_search_service
 from app.services.social_content_aggregator import social_content_aggregator
+from app.services.scrapecreators_service import scrapecreators_service
 from app.models import (
     SourcesListResponse,
     ArticleContent,
@@ -100,15 +103,28 @@ async def startup_event():
         sources = config_manager.load_sources()
         # logger.info(f"Loaded {len(sources)} sources ({config_manager.get_enabled_count()} enabled)")
     except FileNotFoundError:
+        sources = []
         logger.warning("sources.yaml not found - create it in config/ directory")
     except Exception as e:
+        sources = []
         logger.error(f"Failed to load sources: {e}")
+    
+    # Resolve source hosts once to prime the system/upstream resolver cache;
+    # httpx still resolves per connection, so nothing is cached in-process
+    hosts = [urlsplit(source.base_url).hostname for source in sources if source.enabled]
+    try:
+        await asyncio.wait_for(scraper_manager.warmup([host for host in hosts if host]), timeout=5.0)
+    except asyncio.TimeoutError:
+        logger.warning("DNS warmup for sources timed out")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     # logger.info("Shutting down Event Scraper API...")
+    await social_content_aggregator.aclose()
+    await scrapecreators_service.aclose()
+    await scraper_manager.aclose()
 
 
 # Health Check Endpoints
@@ -8,6 +8,11 @@ from loguru import logger
 import re
 
 
+# Characters counted as readable by is_valid_content: letters, digits,
+# whitespace and common punctuation (\w minus "_" is exactly str.isalnum)
+_READABLE_RE = re.compile(r'[^\W_]|[\s.,!?;:()"\'/&%$#@-]')
+
+
 class ContentExtractor:
     """
     Extracts content from HTML using CSS selectors and fallback methods.
@@ -295,10 +300,7 @@ class ContentExtractor:
         # Accept content if it has at least 40% readable characters
         if len(cleaned) > 100:
             # Count alphanumeric + common punctuation + whitespace
-            readable_chars = sum(
-                c.isalnum() or c.isspace() or c in '.,!?;:()-"\'/&%$#@' 
-                for c in cleaned[:1000]  # Check first 1000 chars
-            )
+            readable_chars = len(_READABLE_RE.findall(cleaned[:1000]))  # Check first 1000 chars
             readable_ratio = readable_chars / min(1000, len(cleaned))
             
             # Lowered from 70% to 40% - be lenient, try to salvage content
@@ -3,8 +3,9 @@ Facebook Content Service - Fetch full post details using Facebook Graph API.
 Supports third-party scraping via ScrapeCreators API (configurable via FACEBOOK_SCRAPER env variable).
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import re
+import sys
 import httpx
 from datetime import datetime
 from loguru import logger
@@ -17,6 +18,68 @@ from app.models import (
     SocialContentEngagement
 )
 from app.services.scrapecreators_service import scrapecreators_service
+from app.utils.json_utils import response_json
+
+
+# datetime.fromisoformat() accepts a trailing 'Z' natively from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Possessive quantifiers (Python 3.11+) stop the engine backtracking into runs
+# that are always followed by a character outside their class, so the match
+# result is unchanged but adversarial URLs fail in linear time
+_POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+
+# Post ID patterns; Facebook IDs and usernames are ASCII, so skip Unicode matching
+_NUMERIC_RE = re.compile(
+    rf'facebook\.com/(?P<page>\d+{_POSSESSIVE})/posts/(?:[\w-]+{_POSSESSIVE}/)?(?P<post>\d+)',
+    re.ASCII
+)
+_STORY_FBID_RE = re.compile(r'story_fbid=(\d+)', re.ASCII)
+_PAGE_ID_PARAM_RE = re.compile(r'[?&]id=(\d+)', re.ASCII)
+_USERNAME_RE = re.compile(
+    rf'facebook\.com/(?P<user>[\w.]+{_POSSESSIVE})/posts/(?:[\w-]+{_POSSESSIVE}/)?(?P<post>\d+)',
+    re.ASCII
+)
+_FBID_RE = re.compile(r'fbid=(\d+)', re.ASCII)
+_LONG_NUM_RE = re.compile(r'\d{10,}', re.ASCII)
+
+# Every supported post URL contains one of these; anything else (marketplace,
+# events, watch, ...) can never yield a post ID
+_POST_URL_MARKERS = ('/posts/', 'permalink.php', 'photo.php', 'story_fbid=', 'fbid=')
+
+# Only request what get_post_content reads; limit(0) keeps the summary counts
+# without returning the individual reactions/comments
+_POST_FIELDS = (
+    'message,created_time,from{id,name},full_picture,attachments{media,type},shares,'
+    'reactions.limit(0).summary(total_count),comments.limit(0).summary(total_count)'
+)
+
+# Shared read-only defaults for missing nested Graph API objects (never mutate)
+_EMPTY: Dict[str, Any] = {}
+_EMPTY_LIST: List[Any] = []
+
+
+def _build_photo_media(media_data: Dict[str, Any]) -> SocialContentMedia:
+    """Build image media from a Graph API 'photo' attachment."""
+    image = media_data.get('image') or _EMPTY
+    return SocialContentMedia(type='image', url=image.get('src', ''))
+
+
+def _build_video_media(media_data: Dict[str, Any]) -> SocialContentMedia:
+    """Build video media from a Graph API 'video' attachment."""
+    image = media_data.get('image') or _EMPTY
+    return SocialContentMedia(
+        type='video',
+        url=media_data.get('source', ''),
+        thumbnail_url=image.get('src', '')
+    )
+
+
+# Attachment type -> media builder; other attachment types are skipped
+_ATTACHMENT_MEDIA_BUILDERS = {
+    'photo': _build_photo_media,
+    'video': _build_video_media,
+}
 
 
 class FacebookContentService:
@@ -41,44 +104,46 @@ class FacebookContentService:
         - https://www.facebook.com/groups/GROUP_ID/posts/POST_ID
         - https://www.facebook.com/PAGE_ID/posts/POST_ID (numeric page ID)
         """
+        # Skip the regex cascade entirely for URLs that are not posts
+        if not any(marker in url for marker in _POST_URL_MARKERS):
+            return None
+        
         # Pattern 1: Numeric page ID with post ID (with optional slug)
         # Matches: facebook.com/12345/posts/67890 or facebook.com/12345/posts/slug/67890
-        numeric_pattern = r'facebook\.com\/(\d+)\/posts\/(?:[\w\-]+\/)?(\d+)'
-        match = re.search(numeric_pattern, url)
+        match = _NUMERIC_RE.search(url)
         if match:
-            page_id = match.group(1)
-            post_id = match.group(2)
-            logger.info(f"Extracted numeric page post: {page_id}_{post_id}")
+            page_id = match.group('page')
+            post_id = match.group('post')
+            logger.debug("Extracted numeric page post: {}_{}", page_id, post_id)
             return f"{page_id}_{post_id}"
         
         # Pattern 2: permalink.php format with story_fbid and id parameters
         if 'permalink.php' in url or 'story_fbid' in url:
-            story_fbid_match = re.search(r'story_fbid=(\d+)', url)
-            page_id_match = re.search(r'[?&]id=(\d+)', url)
+            story_fbid_match = _STORY_FBID_RE.search(url)
+            page_id_match = _PAGE_ID_PARAM_RE.search(url)
             if story_fbid_match and page_id_match:
                 story_fbid = story_fbid_match.group(1)
                 page_id = page_id_match.group(1)
-                logger.info(f"Extracted permalink post: {page_id}_{story_fbid}")
+                logger.debug("Extracted permalink post: {}_{}", page_id, story_fbid)
                 return f"{page_id}_{story_fbid}"
         
         # Pattern 3: Username format with OPTIONAL descriptive slug
         # Matches: facebook.com/USERNAME/posts/12345 OR facebook.com/USERNAME/posts/slug-text/12345
         # The slug can contain hyphens, underscores, and multiple words
-        username_pattern = r'facebook\.com\/([\w\.]+)\/posts\/(?:[\w\-]+\/)?([\d]+)'
-        match = re.search(username_pattern, url)
+        match = _USERNAME_RE.search(url)
         if match:
-            username = match.group(1)
-            post_id = match.group(2)
-            logger.info(f"Extracted username post: {username}_{post_id}")
+            username = match.group('user')
+            post_id = match.group('post')
+            logger.debug("Extracted username post: {}_{}", username, post_id)
             # Return format that we'll need to resolve
             return f"{username}_{post_id}"
         
         # Pattern 4: Photo posts
         if 'photo.php' in url:
-            fbid_match = re.search(r'fbid=(\d+)', url)
+            fbid_match = _FBID_RE.search(url)
             if fbid_match:
                 photo_id = fbid_match.group(1)
-                logger.info(f"Extracted photo ID: {photo_id}")
+                logger.debug("Extracted photo ID: {}", photo_id)
                 return photo_id
         
         # Pattern 5: Try to extract from URL path by finding any numeric ID after /posts/
@@ -97,16 +162,16 @@ class FacebookContentService:
                     # Try to find username/page_id before 'posts'
                     if posts_index > 0:
                         username_or_page = parts[posts_index - 1]
-                        logger.info(f"Extracted from path: {username_or_page}_{part}")
+                        logger.debug("Extracted from path: {}_{}", username_or_page, part)
                         return f"{username_or_page}_{part}"
                     else:
-                        logger.info(f"Extracted from path: {part}")
+                        logger.debug("Extracted from path: {}", part)
                         return part
         except (ValueError, IndexError):
             pass
         
         # Pattern 6: Last resort - find any long numeric sequence in URL
-        numeric_sequences = re.findall(r'\d{10,}', url)
+        numeric_sequences = _LONG_NUM_RE.findall(url)
         if numeric_sequences:
             post_id = numeric_sequences[-1]  # Take the last long number
             logger.warning(f"Using last resort extraction: {post_id}")
@@ -136,7 +201,7 @@ class FacebookContentService:
                 # Fall through to native API
         
         # Use native Facebook Graph API
-        logger.info("Using native Facebook Graph API")
+        logger.debug("Using native Facebook Graph API")
         
         if not self.access_token:
             logger.error("Facebook Access Token not configured")
@@ -175,18 +240,18 @@ class FacebookContentService:
                         }
                     )
                     if page_response.status_code == 200:
-                        page_data = page_response.json()
+                        page_data = response_json(page_response)
                         page_id = page_data.get('id')
                         page_name = page_data.get('name', username)
                         if page_id:
                             page_id_format_id = f"{page_id}_{numeric_post_id}"
                             logger.info(f"Resolved username '{username}' ('{page_name}') to page ID: {page_id}")
-                            logger.info(f"Will use format: {page_id_format_id}")
+                            logger.debug("Will use format: {}", page_id_format_id)
                         else:
                             logger.warning(f"Username '{username}' returned empty page ID")
                     else:
                         logger.warning(f"Failed to resolve username '{username}': status {page_response.status_code}")
-                        logger.debug(f"Response: {page_response.text}")
+                        logger.opt(lazy=True).debug("Response: {}", lambda: page_response.text[:500])
             except Exception as e:
                 logger.error(f"Error resolving username '{username}' to page ID: {e}")
         
@@ -216,19 +281,19 @@ class FacebookContentService:
                 # Try each format until one works
                 for format_name, format_id in formats_to_try:
                     try:
-                        logger.info(f"Trying {format_name} format: {format_id}")
+                        logger.debug("Trying {} format: {}", format_name, format_id)
                         response = await client.get(
                             f"{self.base_url}/{format_id}",
                             params={
                                 'access_token': self.access_token,
-                                'fields': 'message,created_time,from,full_picture,attachments,shares,reactions.summary(true),comments.summary(true)'
+                                'fields': _POST_FIELDS
                             }
                         )
                         
                         if response.status_code == 200:
-                            post_data = response.json()
+                            post_data = response_json(response)
                             successful_format = format_name
-                            logger.info(f"Successfully fetched with {format_name} format")
+                            logger.debug("Successfully fetched with {} format", format_name)
                             break
                         else:
                             error_detail = response.text
@@ -242,18 +307,21 @@ class FacebookContentService:
                     return None
                 
                 # Parse created date
-                created_time_str = post_data.get('created_time', '')
+                created_time_str = post_data.get('created_time') or ''
+                if not _FROMISOFORMAT_ACCEPTS_Z:
+                    created_time_str = created_time_str.replace('Z', '+00:00')
                 try:
-                    posted_at = datetime.fromisoformat(created_time_str.replace('Z', '+00:00'))
-                except:
+                    posted_at = datetime.fromisoformat(created_time_str)
+                except ValueError:
                     posted_at = datetime.utcnow()
                 
                 # Get author info
-                from_data = post_data.get('from', {})
+                from_data = post_data.get('from') or _EMPTY
+                from_id = from_data.get('id')
                 author = SocialContentAuthor(
                     name=from_data.get('name', 'Unknown'),
-                    username=from_data.get('id', ''),
-                    profile_url=f"https://www.facebook.com/{from_data.get('id', '')}",
+                    username=from_id or '',
+                    profile_url=f"https://www.facebook.com/{from_id or ''}",
                     verified=False  # Facebook Graph API doesn't easily provide verified status
                 )
                 
@@ -267,27 +335,19 @@ class FacebookContentService:
                     ))
                 
                 # Check attachments for additional media
-                attachments = post_data.get('attachments', {}).get('data', [])
+                attachments_container = post_data.get('attachments') or _EMPTY
+                attachments = attachments_container.get('data') or _EMPTY_LIST
                 for attachment in attachments:
-                    media_data = attachment.get('media', {})
-                    media_type = attachment.get('type', 'photo')
-                    
-                    if media_type == 'photo':
-                        media.append(SocialContentMedia(
-                            type='image',
-                            url=media_data.get('image', {}).get('src', '')
-                        ))
-                    elif media_type == 'video':
-                        media.append(SocialContentMedia(
-                            type='video',
-                            url=media_data.get('source', ''),
-                            thumbnail_url=media_data.get('image', {}).get('src', '')
-                        ))
+                    builder = _ATTACHMENT_MEDIA_BUILDERS.get(attachment.get('type', 'photo'))
+                    if builder:
+                        media.append(builder(attachment.get('media') or _EMPTY))
                 
                 # Build engagement metrics
-                reactions_summary = post_data.get('reactions', {}).get('summary', {})
-                comments_summary = post_data.get('comments', {}).get('summary', {})
-                shares_data = post_data.get('shares', {})
+                reactions = post_data.get('reactions') or _EMPTY
+                reactions_summary = reactions.get('summary') or _EMPTY
+                comments = post_data.get('comments') or _EMPTY
+                comments_summary = comments.get('summary') or _EMPTY
+                shares_data = post_data.get('shares') or _EMPTY
                 
                 engagement = SocialContentEngagement(
                     likes=reactions_summary.get('total_count', 0),
@@ -309,7 +369,7 @@ class FacebookContentService:
                     platform_data={
                         'post_id': successful_format or original_post_id,
                         'format_used': successful_format,
-                        'from_id': from_data.get('id'),
+                        'from_id': from_id,
                         'story': post_data.get('story', ''),
                         'type': post_data.get('type', 'status'),
                     }
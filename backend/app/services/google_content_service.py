@@ -20,6 +20,10 @@ class GoogleContentService:
         self.scraper = ScraperManager(timeout=30.0)
         self.content_extractor = ContentExtractor()
     
+    async def aclose(self):
+        """Close the scraper's pooled HTTP client."""
+        await self.scraper.aclose()
+    
     async def get_content(self, url: str) -> Optional[SocialFullContent]:
         """
         Fetch full content from a Google search result URL.
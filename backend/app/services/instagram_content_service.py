@@ -4,11 +4,14 @@ NOTE: Requires Instagram Business Account connected to Facebook Page.
 Supports third-party scraping via ScrapeCreators API (configurable via INSTAGRAM_SCRAPER env variable).
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Type, TypeVar
+import functools
 import re
+import string
 import httpx
 from datetime import datetime
 from loguru import logger
+from pydantic import BaseModel
 
 from app.settings import settings
 from app.models import (
@@ -20,35 +23,65 @@ from app.models import (
 from app.services.scrapecreators_service import scrapecreators_service
 
 
+_IG_SHORTCODE_PREFIXES = ('instagram.com/p/', 'instagram.com/reel/')
+_IG_SHORTCODE_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+# Fallback for URLs the plain string scan cannot handle
+_IG_SHORTCODE_RE = re.compile(r'instagram\.com/(?:p|reel)/([A-Za-z0-9_-]+)')
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _build_model(model_cls: Type[ModelT], trusted: bool, **fields: Any) -> ModelT:
+    """Build a model, skipping Pydantic validation for trusted, already-typed fields."""
+    return model_cls.model_construct(**fields) if trusted else model_cls(**fields)
+
+
 class InstagramContentService:
     """Service for fetching full Instagram post content."""
     
+    __slots__ = ("access_token", "base_url")
+    
     def __init__(self):
         """Initialize Instagram service with Access Token."""
         self.access_token = settings.instagram_access_token
         self.base_url = "https://graph.instagram.com"
         
-    def extract_media_id(self, url: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def extract_media_id(url: str) -> Optional[str]:
         """
         Extract media ID from Instagram URL.
         
         Note: Instagram Graph API uses different IDs than public URLs.
         This extracts the shortcode which can be converted to media ID.
+        Results are memoized since the same URLs recur across retries and
+        dedupe passes.
         
         Supports:
         - https://www.instagram.com/p/SHORTCODE/
         - https://www.instagram.com/reel/SHORTCODE/
         """
-        patterns = [
-            r'instagram\.com\/(?:p|reel)\/([A-Za-z0-9_-]+)',
-        ]
+        # Fast path: the URL shape is fixed, so find the earliest prefix and
+        # slice up to the next path/query/fragment separator
+        start = -1
+        for prefix in _IG_SHORTCODE_PREFIXES:
+            idx = url.find(prefix)
+            if idx != -1 and (start == -1 or idx < start):
+                start = idx + len(prefix)
+        if start == -1:
+            return None
         
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        end = len(url)
+        for separator in ('/', '?', '#'):
+            idx = url.find(separator, start, end)
+            if idx != -1:
+                end = idx
+        shortcode = url[start:end]
+        if shortcode and _IG_SHORTCODE_CHARS.issuperset(shortcode):
+            return shortcode
         
-        return None
+        match = _IG_SHORTCODE_RE.search(url)
+        return match.group(1) if match else None
     
     async def get_post_content(self, url: str) -> Optional[SocialFullContent]:
         """
@@ -70,7 +103,8 @@ class InstagramContentService:
             logger.info("Using ScrapeCreators API for Instagram content")
             scrapecreators_data = await scrapecreators_service.get_instagram_content(url)
             if scrapecreators_data:
-                return self._convert_scrapecreators_to_model(scrapecreators_data)
+                # Our own formatter produced this dict, so skip re-validating leaf models
+                return self._convert_scrapecreators_to_model(scrapecreators_data, trusted=True)
             else:
                 logger.warning("ScrapeCreators failed, falling back to native Instagram API")
                 # Fall through to native API
@@ -128,30 +162,44 @@ class InstagramContentService:
             logger.error(f"Error fetching Instagram post {shortcode}: {e}", exc_info=True)
             return None
     
-    def _convert_scrapecreators_to_model(self, data: Dict[str, Any]) -> Optional[SocialFullContent]:
+    def _convert_scrapecreators_to_model(self, data: Dict[str, Any], trusted: bool = False) -> Optional[SocialFullContent]:
         """
         Convert ScrapeCreators formatted data to SocialFullContent model.
         
         Args:
             data: Formatted data from ScrapeCreators service
+            trusted: Build author/media/engagement models with model_construct()
+                (no validation) after coercing field types here; the outer
+                SocialFullContent is always validated
         
         Returns:
             SocialFullContent model instance
         """
         try:
-            # Debug log to see data structure
-            # logger.debug(f"ScrapeCreators Instagram data keys: {list(data.keys())}")
-            # logger.debug(f"Instagram media count: {len(data.get('media', []))}")
+            # Debug log to see data structure (lazy: only built when DEBUG is enabled)
+            logger.opt(lazy=True).debug(
+                "ScrapeCreators Instagram data keys: {}, media count: {}",
+                lambda: list(data.keys()),
+                lambda: len(data.get("media", []))
+            )
             
             # Extract author info
             author_data = data.get("author", {})
-            # logger.debug(f"Instagram author_data: name={author_data.get('name')}, username={author_data.get('username')}, profile_image={'present ('+str(len(author_data.get('profile_image', '')))+' chars)' if author_data.get('profile_image') else 'EMPTY'}")
+            profile_image = author_data.get("profile_image") or ""
+            logger.opt(lazy=True).debug(
+                "Instagram author_data: name={}, username={}, profile_image={}",
+                lambda: author_data.get("name"),
+                lambda: author_data.get("username"),
+                lambda: f"present ({len(profile_image)} chars)" if profile_image else "EMPTY"
+            )
             
-            author = SocialContentAuthor(
-                name=author_data.get("name", "Unknown"),
-                username=author_data.get("username", "unknown"),
-                profile_picture=author_data.get("profile_image", ""),
-                verified=author_data.get("verified", False),
+            author = _build_model(
+                SocialContentAuthor,
+                trusted,
+                name=str(author_data.get("name") or "Unknown"),
+                username=str(author_data.get("username") or "unknown"),
+                profile_picture=profile_image,
+                verified=bool(author_data.get("verified", False)),
                 additional_info={
                     'followers': author_data.get("followers", 0)
                 }
@@ -160,28 +208,39 @@ class InstagramContentService:
             # Extract media
             media_list = []
             for m in data.get("media", []):
-                media_type = m.get("type", "image")
-                media_url = m.get("url", "")
-                # logger.debug(f"Instagram media: type={media_type}, url={'present ('+str(len(media_url))+' chars)' if media_url else 'EMPTY'}")
+                media_type = m.get("type") or "image"
+                media_url = m.get("url") or ""
+                duration = m.get("duration")
                 
                 media_list.append(
-                    SocialContentMedia(
+                    _build_model(
+                        SocialContentMedia,
+                        trusted,
                         type=media_type,
                         url=media_url,
-                        thumbnail_url=m.get("thumbnail", ""),
+                        thumbnail_url=m.get("thumbnail") or "",
                         width=None,
                         height=None,
-                        duration_ms=int(m.get("duration", 0) * 1000) if m.get("duration") else None
+                        duration_ms=int(duration * 1000) if duration else None
                     )
                 )
             
+            # One summary line rather than a log call per media item
+            logger.opt(lazy=True).debug(
+                "Instagram media: types={}, missing url={}",
+                lambda: [m.type for m in media_list],
+                lambda: sum(1 for m in media_list if not m.url)
+            )
+            
             # Extract metrics
             metrics = data.get("metrics", {})
-            engagement = SocialContentEngagement(
-                likes=metrics.get("likes", 0) or 0,
-                comments=metrics.get("comments", 0) or 0,
+            engagement = _build_model(
+                SocialContentEngagement,
+                trusted,
+                likes=int(metrics.get("likes") or 0),
+                comments=int(metrics.get("comments") or 0),
                 shares=0,  # Instagram doesn't have shares
-                views=metrics.get("views", 0) or 0
+                views=int(metrics.get("views") or 0)
             )
             
             # Create SocialFullContent
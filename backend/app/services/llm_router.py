@@ -3,6 +3,8 @@ LLM Router: Intelligent routing between Ollama and Claude.
 Handles provider selection, fallback logic, and unified interface.
 """
 
+import time
+import threading
 from typing import Optional, Dict, Any, Tuple
 from loguru import logger
 
@@ -18,20 +20,48 @@ class LLMRouter:
     Features:
     - Provider selection (ollama/claude)
     - Automatic fallback on failure
+    - Per-provider circuit breaker during outages
     - Unified async interface
     - Usage tracking
     """
     
-    PROVIDERS = ["ollama", "claude"]
+    __slots__ = (
+        "default_provider",
+        "default_claude_model",
+        "enable_fallback",
+        "_ollama_client",
+        "_ollama_lock",
+        "_breaker",
+        "_status_cache",
+    )
+    
+    PROVIDERS = frozenset({"ollama", "claude"})
+    STATUS_CACHE_TTL = 30.0  # seconds between provider liveness probes
+    BREAKER_FAILURE_THRESHOLD = 3  # consecutive failures before skipping a provider
+    BREAKER_COOLDOWN = 30.0  # seconds a tripped provider is skipped
     
     def __init__(self):
         """Initialize LLM router."""
-        self.default_provider = settings.default_llm_provider or "ollama"
+        # Normalize once so generate() can use the default without lowercasing
+        self.default_provider = (settings.default_llm_provider or "ollama").lower()
+        if self.default_provider not in self.PROVIDERS:
+            logger.warning(f"Unknown default provider '{self.default_provider}', using ollama")
+            self.default_provider = "ollama"
         self.default_claude_model = settings.default_claude_model or "claude-3-5-haiku-20241022"
-        self.enable_fallback = settings.enable_llm_fallback if hasattr(settings, 'enable_llm_fallback') else True
+        self.enable_fallback = settings.enable_llm_fallback
         
-        # Initialize Ollama client on-demand
+        # Initialize Ollama client on-demand; the lock ensures concurrent first
+        # accesses create one client and run one connection probe
         self._ollama_client = None
+        self._ollama_lock = threading.Lock()
+        
+        # Circuit breaker state per provider
+        self._breaker: Dict[str, Dict[str, float]] = {
+            provider: {"failures": 0, "open_until": 0.0} for provider in self.PROVIDERS
+        }
+        
+        # (checked_at, ollama_available, ollama_model, claude_available)
+        self._status_cache: Optional[Tuple[float, bool, Optional[str], bool]] = None
         
         logger.info(
             f"LLMRouter initialized: default={self.default_provider}, "
@@ -42,19 +72,26 @@ class LLMRouter:
     def ollama_client(self) -> Optional[OllamaClient]:
         """Get or create Ollama client."""
         if self._ollama_client is None:
-            try:
-                self._ollama_client = OllamaClient(
-                    base_url=settings.ollama_base_url,
-                    default_model=settings.ollama_model
-                )
-                if not self._ollama_client.test_connection():
-                    logger.warning("Ollama client created but connection test failed")
-                    self._ollama_client = None
-            except Exception as e:
-                logger.error(f"Failed to create Ollama client: {e}")
-                self._ollama_client = None
+            with self._ollama_lock:
+                if self._ollama_client is None:
+                    self._ollama_client = self._create_ollama_client()
         return self._ollama_client
     
+    def _create_ollama_client(self) -> Optional[OllamaClient]:
+        """Create an Ollama client, returning None if the server is unreachable."""
+        try:
+            client = OllamaClient(
+                base_url=settings.ollama_base_url,
+                default_model=settings.ollama_model
+            )
+            if not client.test_connection():
+                logger.warning("Ollama client created but connection test failed")
+                return None
+            return client
+        except Exception as e:
+            logger.error(f"Failed to create Ollama client: {e}")
+            return None
+    
     async def generate(
         self,
         prompt: str,
@@ -79,8 +116,10 @@ class LLMRouter:
             Tuple of (generated_text, metadata_dict)
             metadata includes: provider, model, tokens, cost (if Claude)
         """
-        provider = provider or self.default_provider
-        provider = provider.lower()
+        if not provider:
+            provider = self.default_provider
+        else:
+            provider = provider.lower()
         
         if provider not in self.PROVIDERS:
             logger.warning(f"Unknown provider '{provider}', defaulting to {self.default_provider}")
@@ -133,12 +172,20 @@ class LLMRouter:
         """
         Generate using specific provider.
         
+        Skips the provider while its circuit breaker is open, so an outage
+        does not cost a full timeout on every request.
+        
         Returns:
             Tuple of (response_text, metadata)
         """
+        breaker = self._breaker[provider]
+        if time.monotonic() < breaker["open_until"]:
+            logger.debug(f"Circuit breaker open for provider '{provider}', skipping")
+            return None, {"skipped": "breaker_open", "provider": provider}
+        
         try:
             if provider == "claude":
-                return await self._generate_claude(
+                response, metadata = await self._generate_claude(
                     prompt=prompt,
                     model=model,
                     max_tokens=max_tokens,
@@ -146,7 +193,7 @@ class LLMRouter:
                     system_prompt=system_prompt
                 )
             else:  # ollama
-                return await self._generate_ollama(
+                response, metadata = await self._generate_ollama(
                     prompt=prompt,
                     model=model,
                     max_tokens=max_tokens,
@@ -155,7 +202,25 @@ class LLMRouter:
         
         except Exception as e:
             logger.error(f"Error with provider '{provider}': {e}", exc_info=True)
-            return None, None
+            response, metadata = None, None
+        
+        if response is None:
+            self._record_failure(provider)
+        else:
+            breaker["failures"] = 0
+        return response, metadata
+    
+    def _record_failure(self, provider: str):
+        """Count a provider failure and open its breaker at the threshold."""
+        breaker = self._breaker[provider]
+        breaker["failures"] += 1
+        if breaker["failures"] >= self.BREAKER_FAILURE_THRESHOLD:
+            breaker["open_until"] = time.monotonic() + self.BREAKER_COOLDOWN
+            breaker["failures"] = 0
+            logger.warning(
+                f"Provider '{provider}' failed {self.BREAKER_FAILURE_THRESHOLD} times in a row, "
+                f"skipping it for {self.BREAKER_COOLDOWN:.0f}s"
+            )
     
     async def _generate_claude(
         self,
@@ -231,7 +296,8 @@ class LLMRouter:
             "provider": "ollama",
             "model": model or client.default_model,
             "usage": {
-                "estimated_tokens": len(response.split())  # Rough estimate
+                # Rough estimate; counting spaces avoids allocating a word list
+                "estimated_tokens": response.count(" ") + 1 if response else 0
             }
         }
         
@@ -250,6 +316,32 @@ class LLMRouter:
             "providers": {}
         }
         
+        ollama_available, ollama_model, claude_available = self._probe_providers()
+        
+        status["providers"]["ollama"] = {
+            "available": ollama_available,
+            "model": ollama_model
+        }
+        
+        status["providers"]["claude"] = {
+            "available": claude_available,
+            "model": self.default_claude_model,
+            "usage_stats": claude_service.get_usage_stats() if claude_available else None
+        }
+        
+        return status
+    
+    def _probe_providers(self) -> Tuple[bool, Optional[str], bool]:
+        """
+        Check provider liveness, reusing results for STATUS_CACHE_TTL seconds.
+        
+        Returns:
+            Tuple of (ollama_available, ollama_model, claude_available)
+        """
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self.STATUS_CACHE_TTL:
+            return self._status_cache[1:]
+        
         # Ollama status
         ollama_available = False
         ollama_model = None
@@ -261,20 +353,11 @@ class LLMRouter:
             except:
                 pass
         
-        status["providers"]["ollama"] = {
-            "available": ollama_available,
-            "model": ollama_model
-        }
-        
         # Claude status
         claude_available = claude_service.is_available()
-        status["providers"]["claude"] = {
-            "available": claude_available,
-            "model": self.default_claude_model,
-            "usage_stats": claude_service.get_usage_stats() if claude_available else None
-        }
         
-        return status
+        self._status_cache = (now, ollama_available, ollama_model, claude_available)
+        return ollama_available, ollama_model, claude_available
     
     def get_claude_usage(self) -> Dict[str, Any]:
         """Get Claude usage statistics."""
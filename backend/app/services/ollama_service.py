@@ -2,16 +2,49 @@
 Ollama client wrapper for LLM interactions.
 """
 
-import json
 import asyncio
+import json
+import re
+import httpx
 import ollama
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from loguru import logger
 
+from app.utils.retry import RETRYABLE_STATUS_CODES, is_transient_http_error, retry_async
+
+
+# Leading ```json / ``` and trailing ``` fences around an LLM JSON answer
+_JSON_FENCE_RE = re.compile(r'\A```(?:json)?|```\Z')
+
+
+def _is_transient_ollama_error(exc: BaseException) -> bool:
+    """Retry Ollama 429/5xx responses and connection failures, not bad requests."""
+    if isinstance(exc, ollama.ResponseError):
+        return exc.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, ConnectionError) or is_transient_http_error(exc)
+
 
 class OllamaClient:
     """Wrapper for Ollama API with error handling and utilities."""
     
+    __slots__ = ("base_url", "default_model", "client", "aclient", "_generation_slots", "_generation_loop")
+    
+    # At most this many async generations run at once; the 4-core CPU box
+    # cannot serve more in parallel and extra requests only contend for RAM
+    MAX_CONCURRENT_GENERATIONS = 2
+    
+    # Static generation options optimized for 16GB RAM, 4-core CPU; only
+    # temperature and num_predict vary per call
+    BASE_OPTIONS = {
+        "num_ctx": 1024,  # Reduced context window (was 1536) to save memory
+        "num_thread": 4,  # Match CPU cores (was 10) - 4 cores = 8 threads
+        "num_gpu": 0,     # CPU only
+        "top_k": 20,      # Reasonable diversity
+        "top_p": 0.9,     # Good nucleus sampling
+        "repeat_penalty": 1.1,  # Reduce repetition
+        "num_batch": 128, # Smaller batch size to reduce memory usage
+    }
+    
     def __init__(self, base_url: str = "http://localhost:11434", default_model: str = "gpt-oss:20b"):
         """
         Initialize Ollama client.
@@ -23,6 +56,13 @@ class OllamaClient:
         self.base_url = base_url
         self.default_model = default_model
         self.client = ollama.Client(host=base_url)
+        # Native async client so async callers await the HTTP response on the
+        # event loop; concurrency is capped by _get_generation_slots()
+        self.aclient = ollama.AsyncClient(host=base_url)
+        # Semaphore is created lazily inside the running loop (Python 3.8
+        # binds asyncio primitives to the loop current at construction)
+        self._generation_slots: Optional[asyncio.Semaphore] = None
+        self._generation_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info(f"OllamaClient initialized with base_url={base_url}, model={default_model}")
     
     def generate(
@@ -52,25 +92,10 @@ class OllamaClient:
         try:
             logger.info(f"LLM call: model={model}, max_tokens={max_tokens}, temp={temperature}, prompt_len={len(prompt)}")
             
-            # Build generation options optimized for 16GB RAM, 4-core CPU
-            options = {
-                "temperature": temperature,
-                "num_ctx": 1024,  # Reduced context window (was 1536) to save memory
-                "num_thread": 4,  # Match CPU cores (was 10) - 4 cores = 8 threads
-                "num_gpu": 0,     # CPU only
-                "top_k": 20,      # Reasonable diversity
-                "top_p": 0.9,     # Good nucleus sampling
-                "repeat_penalty": 1.1,  # Reduce repetition
-                "num_batch": 128, # Smaller batch size to reduce memory usage
-            }
-            
-            if max_tokens:
-                options["num_predict"] = max_tokens
-            
             response = self.client.generate(
                 model=model, 
                 prompt=prompt,
-                options=options
+                options=self._build_options(max_tokens, temperature)
             )
             result = response['response']
             logger.info(f"LLM response: {len(result)} chars generated")
@@ -87,7 +112,11 @@ class OllamaClient:
         temperature: float = 0.7
     ) -> str:
         """
-        Async version of generate that runs in thread pool to avoid blocking.
+        Async version of generate using the native Ollama async client.
+        
+        The response is streamed and joined once at the end rather than
+        buffered by the client as a single payload. Transient server and
+        connection failures are retried with exponential backoff.
         
         Args:
             prompt: Input prompt
@@ -97,15 +126,95 @@ class OllamaClient:
             
         Returns:
             Generated text
+            
+        Raises:
+            Exception: If generation fails
         """
-        # Run the blocking generate call in a thread pool
-        return await asyncio.to_thread(
-            self.generate,
-            prompt=prompt,
-            model=model,
-            max_tokens=max_tokens,
-            temperature=temperature
-        )
+        async def collect() -> str:
+            chunks = [
+                chunk async for chunk in self.generate_stream(
+                    prompt,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            ]
+            return "".join(chunks)
+        
+        result = await retry_async(collect, is_retryable=_is_transient_ollama_error)
+        logger.info(f"LLM response: {len(result)} chars generated")
+        return result
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text from Ollama as it is produced.
+        
+        Args:
+            prompt: Input prompt
+            model: Model name (uses default if None)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            
+        Yields:
+            Generated text fragments in order
+            
+        Raises:
+            Exception: If generation fails
+        """
+        model = model or self.default_model
+        
+        try:
+            logger.info(f"LLM call: model={model}, max_tokens={max_tokens}, temp={temperature}, prompt_len={len(prompt)}")
+            
+            async with self._get_generation_slots():
+                stream = await self.aclient.generate(
+                    model=model,
+                    prompt=prompt,
+                    options=self._build_options(max_tokens, temperature),
+                    stream=True
+                )
+                async for part in stream:
+                    chunk = part['response']
+                    if chunk:
+                        yield chunk
+        except Exception as e:
+            logger.error(f"Ollama generation failed: {e}")
+            raise
+    
+    def _get_generation_slots(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent generations on the running loop.
+        
+        Returns:
+            Semaphore allowing MAX_CONCURRENT_GENERATIONS holders
+        """
+        loop = asyncio.get_running_loop()
+        if self._generation_loop is not loop:
+            self._generation_slots = asyncio.Semaphore(self.MAX_CONCURRENT_GENERATIONS)
+            self._generation_loop = loop
+        return self._generation_slots
+    
+    def _build_options(self, max_tokens: Optional[int], temperature: float) -> Dict[str, Any]:
+        """
+        Build per-call generation options from the static template.
+        
+        Args:
+            max_tokens: Maximum tokens to generate (None for model default)
+            temperature: Sampling temperature
+            
+        Returns:
+            Ollama options dictionary
+        """
+        options = {**self.BASE_OPTIONS, "temperature": temperature}
+        if max_tokens:
+            options["num_predict"] = max_tokens
+        return options
     
     def generate_json(self, prompt: str, model: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -144,29 +253,23 @@ class OllamaClient:
         Returns:
             Clean JSON text
         """
-        text = text.strip()
-        
         # Remove ```json and ``` markers if present
-        if text.startswith('```json'):
-            text = text[7:]
-        elif text.startswith('```'):
-            text = text[3:]
-        
-        if text.endswith('```'):
-            text = text[:-3]
-        
-        return text.strip()
+        return _JSON_FENCE_RE.sub('', text.strip()).strip()
     
     def test_connection(self) -> bool:
         """
         Test connection to Ollama server.
         
+        Uses the cheap list-models endpoint rather than running an inference.
+        
         Returns:
             True if connection is successful
         """
         try:
-            # Try a simple generation
-            response = self.generate("Test", model=self.default_model)
+            response = httpx.get(f"{self.base_url}/api/tags", timeout=5.0)
+            if response.status_code != 200:
+                logger.error(f"Ollama connection test failed: status {response.status_code}")
+                return False
             logger.info("Ollama connection test successful")
             return True
         except Exception as e:
@@ -5,9 +5,13 @@ This service filters and ranks events based on user queries.
 It considers text similarity, location matching, date ranges, and event types.
 """
 
-from typing import List, Optional, Dict, Set
+from typing import Any, Callable, FrozenSet, List, NamedTuple, Optional, Dict, Tuple
 from datetime import datetime, timedelta
+import functools
+import heapq
 import re
+import sys
+import weakref
 from difflib import SequenceMatcher
 
 from app.models import (
@@ -18,6 +22,126 @@ from app.models import (
 )
 from app.utils.logger import logger
 
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+def _ratio_scorer(query: str) -> Callable[[str], float]:
+    """
+    Build a function returning the similarity ratio of a string to query.
+    
+    Uses RapidFuzz's C++ implementation when installed. The difflib fallback
+    is the plain SequenceMatcher(None, query, text).ratio() call, so scores
+    stay identical to the pure-Python baseline.
+    
+    Args:
+        query: Fixed string every call is compared against
+        
+    Returns:
+        Function mapping a string to a ratio in [0.0, 1.0]
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return lambda text: fuzz.ratio(query, text) / 100.0
+    return lambda text: SequenceMatcher(None, query, text).ratio()
+
+
+_WS_RE = re.compile(r'\s+')
+
+# Common stop words excluded from keyword matching
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'it', 'its', 'they', 'them', 'their'
+})
+
+# Text similarity blend: keyword overlap vs. sequence matching
+_KEYWORD_WEIGHT = 0.7
+_SEQUENCE_WEIGHT = 0.3
+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:
+    def _popcount(mask: int) -> int:
+        """Number of set bits in mask (int.bit_count needs Python 3.10)."""
+        return bin(mask).count("1")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Lowercase text and collapse whitespace (cached: locations and phrases repeat)."""
+    if not text:
+        return ""
+    return _WS_RE.sub(' ', text.lower().strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize(text: str) -> FrozenSet[str]:
+    """
+    Keywords of already lowercased text, in a single split-and-filter pass.
+    
+    split() drops surrounding and repeated whitespace itself, so no separate
+    normalization is needed. Cached, so the result is immutable and shared.
+    """
+    return frozenset(
+        word for word in text.split()
+        if len(word) > 2 and word not in _STOP_WORDS
+    )
+
+
+def _date_decay(days_outside: int) -> float:
+    """Date score for an event days_outside days beyond the query range."""
+    if days_outside > 30:
+        return 0.0
+    return 1.0 - (days_outside / 30.0)
+
+
+# Date scorers specialized on which bounds the query sets, so the per-event
+# loop never re-checks bound presence. Each takes a non-empty event date.
+
+def _date_score_both(event_date: datetime, date_from: datetime, date_to: datetime) -> float:
+    """Score against a range with both bounds."""
+    if event_date < date_from:
+        return _date_decay((date_from - event_date).days)
+    if event_date > date_to:
+        return _date_decay((event_date - date_to).days)
+    return 1.0
+
+
+def _date_score_from(event_date: datetime, date_from: datetime,
+                     date_to: Optional[datetime]) -> float:
+    """Score against a range with only a start date."""
+    if event_date < date_from:
+        return _date_decay((date_from - event_date).days)
+    return 1.0
+
+
+def _date_score_to(event_date: datetime, date_from: Optional[datetime],
+                   date_to: datetime) -> float:
+    """Score against a range with only an end date."""
+    if event_date > date_to:
+        return _date_decay((event_date - date_to).days)
+    return 1.0
+
+
+# (has date_from, has date_to) -> scorer
+_DATE_SCORERS = {
+    (True, True): _date_score_both,
+    (True, False): _date_score_from,
+    (False, True): _date_score_to,
+}
+
+
+class _EventFeatures(NamedTuple):
+    """Query-independent text features of an event, computed once per event."""
+    text: str                 # Lowercased "title summary"
+    mask: int                 # Keywords of text as a bitmask over the matcher vocabulary
+    keyword_count: int        # Number of keywords (bits set in mask)
+
 
 class QueryMatcher:
     """
@@ -31,6 +155,10 @@ class QueryMatcher:
     - Weighted relevance scoring
     """
     
+    # Vocabulary size at which token bit positions are reassigned from scratch,
+    # keeping keyword bitmasks from growing without bound
+    MAX_VOCAB_SIZE = 20000
+    
     def __init__(self):
         """Initialize the query matcher."""
         self.weights = {
@@ -39,6 +167,12 @@ class QueryMatcher:
             'date': 0.20,      # 20% weight for date relevance
             'event_type': 0.15 # 15% weight for event type matching
         }
+        # Per-object feature caches keyed by id(); each entry holds a weak
+        # reference so it is dropped when the event/location is collected
+        self._event_cache: Dict[int, Tuple[weakref.ref, _EventFeatures]] = {}
+        self._location_cache: Dict[int, Tuple[weakref.ref, Tuple[str, ...]]] = {}
+        # Keyword -> bit position, shared by query and event keyword bitmasks
+        self._vocab: Dict[str, int] = {}
         logger.info("QueryMatcher initialized with weights: {}", self.weights)
     
     def normalize_text(self, text: str) -> str:
@@ -51,14 +185,9 @@ class QueryMatcher:
         Returns:
             Normalized text (lowercase, no extra spaces)
         """
-        if not text:
-            return ""
-        # Convert to lowercase, remove extra whitespace
-        text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        return _normalize_text(text)
     
-    def extract_keywords(self, text: str) -> Set[str]:
+    def extract_keywords(self, text: str) -> FrozenSet[str]:
         """
         Extract keywords from text.
         
@@ -69,25 +198,82 @@ class QueryMatcher:
             Set of keywords
         """
         if not text:
-            return set()
-        
-        # Normalize text
-        text = self.normalize_text(text)
-        
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these',
-            'those', 'it', 'its', 'they', 'them', 'their'
-        }
+            return frozenset()
+        return _tokenize(text.lower())
+    
+    def _cached(self, cache: Dict[int, Tuple[weakref.ref, Any]], obj: Any,
+                build: Callable[[Any], Any]) -> Any:
+        """
+        Return build(obj), memoized per object for the object's lifetime.
         
-        # Split into words and filter
-        words = text.split()
-        keywords = {word for word in words if len(word) > 2 and word not in stop_words}
+        Args:
+            cache: Cache dict owned by this matcher
+            obj: Object the value is derived from (must be weak-referenceable)
+            build: Function computing the value from obj
+            
+        Returns:
+            Cached or freshly built value
+        """
+        key = id(obj)
+        entry = cache.get(key)
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        
+        value = build(obj)
+        cache[key] = (weakref.ref(obj, lambda _ref: cache.pop(key, None)), value)
+        return value
+    
+    def _keyword_mask(self, keywords: FrozenSet[str]) -> int:
+        """
+        Encode keywords as a bitmask, assigning new bit positions as needed.
         
-        return keywords
+        Args:
+            keywords: Keywords to encode
+            
+        Returns:
+            Bitmask with one bit set per keyword
+        """
+        vocab = self._vocab
+        mask = 0
+        for word in keywords:
+            bit = vocab.get(word)
+            if bit is None:
+                bit = vocab[word] = len(vocab)
+            mask |= 1 << bit
+        return mask
+    
+    def _query_mask(self, keywords: FrozenSet[str]) -> int:
+        """
+        Encode query keywords, first resetting the vocabulary if it is full.
+        
+        Resetting invalidates every cached event mask, so it only happens
+        here, before a query is scored, never in the middle of a batch.
+        
+        Args:
+            keywords: Query keywords
+            
+        Returns:
+            Query keyword bitmask
+        """
+        if len(self._vocab) > self.MAX_VOCAB_SIZE:
+            logger.debug(f"Keyword vocabulary reached {len(self._vocab)} tokens, resetting")
+            self._vocab.clear()
+            self._event_cache.clear()
+        return self._keyword_mask(keywords)
+    
+    def _build_event_features(self, event: EventData) -> _EventFeatures:
+        """Compute the query-independent text features of an event."""
+        text = f"{event.title} {event.summary}".lower()
+        keywords = _tokenize(text)
+        return _EventFeatures(text, self._keyword_mask(keywords), len(keywords))
+    
+    def _build_location_parts(self, location: Location) -> Tuple[str, ...]:
+        """Normalize the non-empty city, country and region of a location."""
+        return tuple(
+            self.normalize_text(part)
+            for part in (location.city, location.country, location.region)
+            if part
+        )
     
     def calculate_text_similarity(self, query_text: str, event: EventData) -> float:
         """
@@ -103,31 +289,62 @@ class QueryMatcher:
         if not query_text:
             return 0.0
         
-        # Combine event title and summary
-        event_text = f"{event.title} {event.summary}".lower()
         query_text = query_text.lower()
-        
-        # Method 1: Keyword overlap
-        query_keywords = self.extract_keywords(query_text)
-        event_keywords = self.extract_keywords(event_text)
+        query_keywords = _tokenize(query_text)
         
         if not query_keywords:
             return 0.0
         
-        # Calculate Jaccard similarity
-        intersection = query_keywords.intersection(event_keywords)
-        union = query_keywords.union(event_keywords)
+        query_mask = self._query_mask(query_keywords)
         
-        keyword_score = len(intersection) / len(union) if union else 0.0
+        # Combined title/summary and its keywords are cached per event
+        features = self._cached(self._event_cache, event, self._build_event_features)
         
-        # Method 2: Sequence matching (for phrases)
-        sequence_score = SequenceMatcher(None, query_text, event_text).ratio()
+        return self._text_score(
+            query_mask, len(query_keywords), features, _ratio_scorer(query_text)(features.text)
+        )
+    
+    def _text_score(self, query_mask: int, query_count: int, features: _EventFeatures,
+                    sequence_score: float) -> float:
+        """
+        Combine keyword overlap with a precomputed sequence similarity.
         
+        Args:
+            query_mask: Non-zero keyword bitmask of the query text
+            query_count: Number of query keywords
+            features: Cached features of the event
+            sequence_score: Sequence ratio of the query text to features.text
+            
+        Returns:
+            Similarity score (0.0 to 1.0)
+        """
+        # Method 1: Keyword overlap (Jaccard similarity on bitmasks);
+        # |A | B| = |A| + |B| - |A & B|, so only the intersection is counted
+        intersection = _popcount(query_mask & features.mask)
+        keyword_score = intersection / (query_count + features.keyword_count - intersection)
+        
+        # Method 2: Sequence matching (for phrases), passed in by the caller
         # Combine scores (weighted toward keyword matching)
-        combined_score = (keyword_score * 0.7) + (sequence_score * 0.3)
+        combined_score = (keyword_score * _KEYWORD_WEIGHT) + (sequence_score * _SEQUENCE_WEIGHT)
         
         return min(1.0, combined_score)
     
+    def _sequence_scores(self, query_text: str, texts: List[str]) -> List[float]:
+        """
+        Sequence similarity of the query text to each of texts.
+        
+        One scorer is built for the query and reused across the batch.
+        
+        Args:
+            query_text: Lowercased query text
+            texts: Lowercased event texts
+            
+        Returns:
+            Ratios (0.0 to 1.0), aligned with texts
+        """
+        ratio = _ratio_scorer(query_text)
+        return [ratio(text) for text in texts]
+    
     def calculate_location_similarity(
         self,
         query_location: Optional[str],
@@ -147,33 +364,35 @@ class QueryMatcher:
             return 0.0
         
         query_location = self.normalize_text(query_location)
+        return self._location_score(query_location, _ratio_scorer(query_location), event_location)
+    
+    def _location_score(self, query_location: str, ratio: Callable[[str], float],
+                        event_location: Optional[Location]) -> float:
+        """
+        Location similarity for an already normalized query location.
         
-        # Check each location component
-        scores = []
-        
-        if event_location.city:
-            city = self.normalize_text(event_location.city)
-            if city in query_location or query_location in city:
-                scores.append(1.0)
-            else:
-                scores.append(SequenceMatcher(None, query_location, city).ratio())
-        
-        if event_location.country:
-            country = self.normalize_text(event_location.country)
-            if country in query_location or query_location in country:
-                scores.append(1.0)
-            else:
-                scores.append(SequenceMatcher(None, query_location, country).ratio())
-        
-        if event_location.region:
-            region = self.normalize_text(event_location.region)
-            if region in query_location or query_location in region:
-                scores.append(1.0)
-            else:
-                scores.append(SequenceMatcher(None, query_location, region).ratio())
+        Args:
+            query_location: Normalized, non-empty query location
+            ratio: Sequence similarity scorer for query_location
+            event_location: Event location object
+            
+        Returns:
+            Similarity score (0.0 to 1.0)
+        """
+        if not event_location:
+            return 0.0
+        
+        # Components are normalized once per location
+        parts = self._cached(self._location_cache, event_location, self._build_location_parts)
+        
+        # A substring match on any component is already the maximum score,
+        # so fuzzy ratios are only computed when none matches
+        for part in parts:
+            if part in query_location or query_location in part:
+                return 1.0
         
         # Return max score from all components
-        return max(scores) if scores else 0.0
+        return max(map(ratio, parts), default=0.0)
     
     def calculate_date_relevance(
         self,
@@ -190,35 +409,36 @@ class QueryMatcher:
         Returns:
             Relevance score (0.0 to 1.0)
         """
+        return self._date_scores(query, [event])[0]
+    
+    def _date_scores(self, query: SearchQuery, events: List[EventData]) -> List[float]:
+        """
+        Calculate date relevance for a batch of events in one pass.
+        
+        The query's date range is read once for the whole batch, and a query
+        without a range short-circuits to a constant column.
+        
+        Args:
+            query: Search query with date range
+            events: Events to evaluate
+            
+        Returns:
+            Relevance scores (0.0 to 1.0), aligned with events
+        """
+        date_from = query.date_from
+        date_to = query.date_to
+        
         # If no date range specified, give neutral score
-        if not query.date_from and not query.date_to:
-            return 0.5
-        
-        # If event has no date, give low score if date range specified
-        if not event.event_date:
-            return 0.3
-        
-        event_date = event.event_date
-        
-        # Check if event is within range
-        if query.date_from and event_date < query.date_from:
-            # Event is before range - calculate how far
-            days_before = (query.date_from - event_date).days
-            if days_before > 30:
-                return 0.0
-            else:
-                return 1.0 - (days_before / 30.0)
-        
-        if query.date_to and event_date > query.date_to:
-            # Event is after range - calculate how far
-            days_after = (event_date - query.date_to).days
-            if days_after > 30:
-                return 0.0
-            else:
-                return 1.0 - (days_after / 30.0)
-        
-        # Event is within range
-        return 1.0
+        if not date_from and not date_to:
+            return [0.5] * len(events)
+        
+        # Scorer specialized on the range shape; events without a date get
+        # a low score since a range was requested
+        score = _DATE_SCORERS[(bool(date_from), bool(date_to))]
+        return [
+            score(event.event_date, date_from, date_to) if event.event_date else 0.3
+            for event in events
+        ]
     
     def calculate_event_type_match(
         self,
@@ -243,40 +463,49 @@ class QueryMatcher:
     def calculate_relevance_score(
         self,
         query: SearchQuery,
-        event: EventData
+        event: EventData,
+        min_score: float = 0.0
     ) -> float:
         """
         Calculate overall relevance score for an event.
         
+        Scores are computed cheapest first (type, date, location, text); as
+        soon as full marks on the remaining components could not lift the
+        event to min_score, scoring stops.
+        
         Args:
             query: Search query
             event: Event to score
+            min_score: Threshold below which the exact score is not needed
             
         Returns:
-            Relevance score (0.0 to 1.0)
+            Relevance score (0.0 to 1.0), or 0.0 if it cannot reach min_score
         """
-        # Calculate individual scores
-        text_score = self.calculate_text_similarity(query.phrase, event)
-        location_score = self.calculate_location_similarity(query.location, event.location)
-        date_score = self.calculate_date_relevance(query, event)
+        weights = self.weights
+        
         type_score = self.calculate_event_type_match(query.event_type, event.event_type)
+        date_score = self.calculate_date_relevance(query, event)
+        weighted_score = date_score * weights['date'] + type_score * weights['event_type']
+        if (weighted_score + weights['location'] + weights['text']) * event.confidence < min_score:
+            return 0.0
         
-        # Apply weights
-        weighted_score = (
-            text_score * self.weights['text'] +
-            location_score * self.weights['location'] +
-            date_score * self.weights['date'] +
-            type_score * self.weights['event_type']
-        )
+        location_score = self.calculate_location_similarity(query.location, event.location)
+        weighted_score += location_score * weights['location']
+        if (weighted_score + weights['text']) * event.confidence < min_score:
+            return 0.0
+        
+        text_score = self.calculate_text_similarity(query.phrase, event)
+        weighted_score += text_score * weights['text']
         
         # Adjust by event confidence
         final_score = weighted_score * event.confidence
         
+        # Positional args are only formatted if the record is emitted
         logger.debug(
-            f"Relevance scores for '{event.title[:30]}...': "
-            f"text={text_score:.2f}, loc={location_score:.2f}, "
-            f"date={date_score:.2f}, type={type_score:.2f}, "
-            f"weighted={weighted_score:.2f}, final={final_score:.2f}"
+            "Relevance scores for '{:.30}...': text={:.2f}, loc={:.2f}, "
+            "date={:.2f}, type={:.2f}, weighted={:.2f}, final={:.2f}",
+            event.title, text_score, location_score,
+            date_score, type_score, weighted_score, final_score
         )
         
         return final_score
@@ -285,7 +514,8 @@ class QueryMatcher:
         self,
         events: List[EventData],
         query: SearchQuery,
-        min_score: float = 0.3
+        min_score: float = 0.3,
+        top_k: Optional[int] = None
     ) -> List[Dict]:
         """
         Match and rank events based on query.
@@ -294,25 +524,106 @@ class QueryMatcher:
             events: List of events to match
             query: Search query
             min_score: Minimum relevance score threshold
+            top_k: Only return the top_k highest scoring events (all if None)
             
         Returns:
             List of dicts with event and relevance_score, sorted by score
         """
         logger.info(f"Matching {len(events)} events against query: '{query.phrase}'")
         
-        # Calculate relevance for each event
-        scored_events = []
-        for event in events:
-            score = self.calculate_relevance_score(query, event)
+        # Query-side work is done once; each score is then computed as a
+        # column over the whole batch instead of event by event
+        query_text = (query.phrase or "").lower()
+        query_keywords = _tokenize(query_text)
+        query_mask = self._query_mask(query_keywords) if query_keywords else 0
+        query_location = self.normalize_text(query.location) if query.location else ""
+        
+        w_text = self.weights['text']
+        w_location = self.weights['location']
+        w_date = self.weights['date']
+        w_type = self.weights['event_type']
+        
+        # Cheap scores first
+        date_scores = self._date_scores(query, events)
+        type_scores = [self.calculate_event_type_match(query.event_type, e.event_type) for e in events]
+        base_scores = [
+            date * w_date + etype * w_type
+            for date, etype in zip(date_scores, type_scores)
+        ]
+        
+        # Cascade: text and location scores are at most 1.0, so events that
+        # cannot reach min_score even with full marks there are dropped
+        # before any fuzzy matching runs
+        headroom = (w_text if query_mask else 0.0) + (w_location if query_location else 0.0)
+        candidates = [
+            i for i, (base, event) in enumerate(zip(base_scores, events))
+            if (base + headroom) * event.confidence >= min_score
+        ]
+        if len(candidates) < len(events):
+            logger.debug(f"Pre-filter skipped {len(events) - len(candidates)} events")
+        
+        if query_mask:
+            features = [
+                self._cached(self._event_cache, events[i], self._build_event_features)
+                for i in candidates
+            ]
             
-            if score >= min_score:
-                scored_events.append({
-                    'event': event,
-                    'relevance_score': score
-                })
-        
-        # Sort by relevance score (descending)
-        scored_events.sort(key=lambda x: x['relevance_score'], reverse=True)
+            # Events sharing no keyword with the query (the posting-list test,
+            # done on the cached bitmasks) score 0 on keyword overlap, capping
+            # their text score at _SEQUENCE_WEIGHT; drop those that then
+            # cannot reach min_score
+            no_overlap_headroom = headroom - w_text * _KEYWORD_WEIGHT
+            kept = [
+                k for k, (i, f) in enumerate(zip(candidates, features))
+                if query_mask & f.mask
+                or (base_scores[i] + no_overlap_headroom) * events[i].confidence >= min_score
+            ]
+            if len(kept) < len(candidates):
+                logger.debug(f"Keyword filter skipped {len(candidates) - len(kept)} events")
+                candidates = [candidates[k] for k in kept]
+                features = [features[k] for k in kept]
+            
+            query_count = len(query_keywords)
+            sequence_scores = self._sequence_scores(query_text, [f.text for f in features])
+            
+            # Same arithmetic as _text_score, fused into flat comprehensions
+            # so the batch pays no per-event method call
+            intersections = [_popcount(query_mask & f.mask) for f in features]
+            text_scores = [
+                min(1.0,
+                    inter / (query_count + f.keyword_count - inter) * _KEYWORD_WEIGHT
+                    + sequence_score * _SEQUENCE_WEIGHT)
+                for f, inter, sequence_score in zip(features, intersections, sequence_scores)
+            ]
+        else:
+            text_scores = [0.0] * len(candidates)
+        
+        if query_location:
+            location_ratio = _ratio_scorer(query_location)
+            location_scores = [
+                self._location_score(query_location, location_ratio, events[i].location)
+                for i in candidates
+            ]
+        else:
+            location_scores = [0.0] * len(candidates)
+        
+        # Weighted sum adjusted by event confidence
+        final_scores = [
+            (base_scores[i] + text * w_text + location * w_location) * events[i].confidence
+            for i, text, location in zip(candidates, text_scores, location_scores)
+        ]
+        
+        # Rank indices (partial selection when only the top_k are wanted),
+        # then build result dicts for the returned events only
+        ranked = [k for k, score in enumerate(final_scores) if score >= min_score]
+        if top_k is not None and top_k < len(ranked):
+            ranked = heapq.nlargest(top_k, ranked, key=final_scores.__getitem__)
+        else:
+            ranked.sort(key=final_scores.__getitem__, reverse=True)
+        scored_events = [
+            {'event': events[candidates[k]], 'relevance_score': final_scores[k]}
+            for k in ranked
+        ]
         
         logger.info(
             f"Matched {len(scored_events)}/{len(events)} events "
@@ -341,18 +652,17 @@ class QueryMatcher:
         if not date_from and not date_to:
             return events
         
-        filtered = []
-        for event in events:
-            if not event.event_date:
-                continue
-            
-            if date_from and event.event_date < date_from:
-                continue
-            
-            if date_to and event.event_date > date_to:
-                continue
-            
-            filtered.append(event)
+        # One comprehension per range shape keeps the bound checks out of
+        # the per-event loop
+        if date_from and date_to:
+            filtered = [
+                e for e in events
+                if e.event_date and date_from <= e.event_date <= date_to
+            ]
+        elif date_from:
+            filtered = [e for e in events if e.event_date and e.event_date >= date_from]
+        else:
+            filtered = [e for e in events if e.event_date and e.event_date <= date_to]
         
         logger.debug(f"Date filter: {len(filtered)}/{len(events)} events")
         return filtered
@@ -3,89 +3,307 @@ ScrapeCreators Third-Party API Service
 Documentation: https://docs.scrapecreators.com/
 """
 
+import asyncio
+import copy
+import functools
+import time
 import httpx
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
-from app.settings import Settings
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+from app.settings import settings
+from app.utils.json_utils import response_json
+from app.utils.rate_limiter import AIMDLimiter
+from app.utils.retry import RETRYABLE_STATUS_CODES, retry_async
 
 logger = logging.getLogger(__name__)
-settings = Settings()
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _twitter_timestamp_to_iso(created_at: str) -> str:
+    """
+    Convert a Twitter created_at string to ISO 8601.
+    
+    The format is fixed-width ASCII ("Thu Feb 23 14:52:10 +0000 2023"), so
+    fields are sliced directly instead of going through strptime; anything
+    that does not fit the layout falls back to strptime.
+    
+    Args:
+        created_at: Twitter timestamp
+    
+    Returns:
+        ISO 8601 timestamp
+    
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    try:
+        if len(created_at) != 30 or created_at[20] not in "+-":
+            raise ValueError(created_at)
+        offset = int(created_at[21:23]) * 60 + int(created_at[23:25])
+        tz = timezone.utc if offset == 0 else timezone(
+            timedelta(minutes=-offset if created_at[20] == "-" else offset)
+        )
+        return datetime(
+            int(created_at[26:30]), _MONTHS[created_at[4:7]], int(created_at[8:10]),
+            int(created_at[11:13]), int(created_at[14:16]), int(created_at[17:19]),
+            tzinfo=tz
+        ).isoformat()
+    except (KeyError, ValueError):
+        return datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y").isoformat()
+
+
+# Hosts served by each get_*_content endpoint (subdomains such as www. and
+# mobile. match too)
+_PLATFORM_HOSTS = (
+    ("twitter", frozenset({"twitter.com", "x.com"})),
+    ("facebook", frozenset({"facebook.com", "fb.com"})),
+    ("instagram", frozenset({"instagram.com"})),
+)
+
+
+def _platform_of(url: str) -> Optional[str]:
+    """
+    Identify the social platform of a URL from its hostname.
+    
+    Args:
+        url: Post URL
+    
+    Returns:
+        "twitter", "facebook", "instagram" or None if unsupported
+    """
+    host = (urlparse(url).hostname or "").rstrip(".")
+    for platform, domains in _PLATFORM_HOSTS:
+        if host in domains or any(host.endswith("." + domain) for domain in domains):
+            return platform
+    return None
+
+
+def _dig(d: Any, *keys: str, default: Any = None) -> Any:
+    """
+    Walk nested dicts without allocating empty fallbacks at each level.
+    
+    Args:
+        d: Root object
+        *keys: Keys to follow in order
+        default: Value returned when a key is missing, null or not a dict
+    
+    Returns:
+        The nested value or default
+    """
+    for key in keys:
+        d = d.get(key) if isinstance(d, dict) else None
+        if d is None:
+            return default
+    return d
 
 
 class ScrapeCreatorsService:
     """Service for fetching social media content using ScrapeCreators API."""
     
+    # Successful responses are reused for repeat URLs (each call costs credits)
+    CACHE_TTL = 3600.0  # seconds
+    CACHE_MAX_ENTRIES = 1024
+    # Bound on the summed body sizes of cached payloads
+    CACHE_MAX_BYTES = 16 * 1024 * 1024
+    
     def __init__(self):
         """Initialize ScrapeCreators service."""
         self.api_key = settings.scrapecreators_api_key
         self.base_url = "https://api.scrapecreators.com"
         self.timeout = 30  # 30 seconds timeout
+        self.include_raw = settings.scrapecreators_include_raw
+        self._http: Optional[httpx.AsyncClient] = None
+        # Adaptive cap on concurrent calls; backs off on 429s and timeouts
+        self._limiter = AIMDLimiter(initial=8, max_limit=16)
+        # (path, params) -> (fetched_at, decoded payload, body size), oldest first
+        self._cache: "OrderedDict[Tuple[str, Tuple], Tuple[float, Any, int]]" = OrderedDict()
+        self._cache_bytes = 0
         
         if not self.api_key:
             logger.warning("ScrapeCreators API key not configured. Set SCRAPECREATORS_API_KEY in .env")
     
-    async def get_twitter_content(self, url: str) -> Optional[Dict[str, Any]]:
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client shared by all ScrapeCreators calls."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"x-api-key": self.api_key or ""},
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the pooled HTTP client (call on application shutdown)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def __aenter__(self) -> "ScrapeCreatorsService":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def _request(self, path: str, params: Dict[str, Any]) -> httpx.Response:
         """
-        Fetch Twitter/X tweet content using ScrapeCreators API.
+        Send one GET through the concurrency limiter.
+        
+        The response is streamed and its body only read for 200s; error
+        bodies (often large HTML pages) are dropped unread.
         
         Args:
-            url: Tweet URL (e.g., https://twitter.com/user/status/123456789)
+            path: API path relative to base_url
+            params: Query parameters
         
         Returns:
-            Formatted content dict or None on error
+            The response, with content loaded only if the status is 200
+        
+        Raises:
+            httpx.HTTPStatusError: For 429/5xx responses, so they can be retried
+        """
+        await self._limiter.acquire()
+        started = time.monotonic()
+        overloaded = True
+        try:
+            client = self._get_http()
+            response = await client.send(client.build_request("GET", path, params=params), stream=True)
+            try:
+                overloaded = (
+                    response.status_code == 429
+                    or response.headers.get("x-ratelimit-remaining") == "0"
+                )
+                if response.status_code == 200:
+                    await response.aread()
+            finally:
+                await response.aclose()
+        finally:
+            self._limiter.release(time.monotonic() - started, overloaded)
+        
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            response.raise_for_status()
+        return response
+    
+    def _evict(self, key: Tuple[str, Tuple]):
+        """Drop one cache entry and its size from the byte total."""
+        self._cache_bytes -= self._cache.pop(key)[2]
+    
+    def _store(self, key: Tuple[str, Tuple], data: Any, size: int):
+        """
+        Cache a decoded payload, evicting the oldest entries to stay in bounds.
+        
+        Args:
+            key: Cache key (path, sorted params)
+            data: Decoded JSON payload; a private copy is stored
+            size: Response body size in bytes, used for the byte bound
+        """
+        if size > self.CACHE_MAX_BYTES:
+            return
+        if key in self._cache:
+            self._evict(key)
+        self._cache[key] = (time.monotonic(), copy.deepcopy(data), size)
+        self._cache_bytes += size
+        while len(self._cache) > self.CACHE_MAX_ENTRIES or self._cache_bytes > self.CACHE_MAX_BYTES:
+            self._evict(next(iter(self._cache)))
+    
+    async def _get_json(self, path: str, params: Dict[str, Any],
+                        platform: str) -> Optional[Dict[str, Any]]:
+        """
+        GET a ScrapeCreators endpoint and decode its JSON body.
+        
+        Args:
+            path: API path relative to base_url (e.g., /v1/twitter/tweet)
+            params: Query parameters
+            platform: Platform name used in log messages
+        
+        Returns:
+            Decoded JSON response or None on error
         """
         if not self.api_key:
             logger.error("ScrapeCreators API key not configured")
             return None
         
+        # Hits return a copy of the decoded payload, so callers never share
+        # (and mutate) the cached data
+        key = (path, tuple(sorted(params.items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self.CACHE_TTL:
+                self._cache.move_to_end(key)
+                logger.debug("ScrapeCreators cache hit for %s %s", path, params)
+                return copy.deepcopy(cached[1])
+            self._evict(key)
+        
         try:
-            logger.info(f"Fetching Twitter content via ScrapeCreators: {url}")
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/v1/twitter/tweet",
-                    params={"url": url},
-                    headers={"x-api-key": self.api_key}
-                )
+            # Transient failures (timeouts, 429/5xx) are retried with backoff;
+            # 401/402 are returned as-is since retrying cannot fix them
+            try:
+                response = await retry_async(lambda: self._request(path, params))
+            except httpx.HTTPStatusError as e:
+                response = e.response
+            
+            if response.status_code == 200:
+                data = response_json(response)
+                self._store(key, data, len(response.content))
+                return data
+            elif response.status_code == 401:
+                logger.error("ScrapeCreators: Invalid API key")
+            elif response.status_code == 402:
+                logger.error("ScrapeCreators: Insufficient credits")
+            else:
+                logger.error(f"ScrapeCreators API error: {response.status_code}")
+            return None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    # Check if data has "data" key (nested) or direct keys
-                    if "data" in data:
-                        logger.debug(f"Nested 'data' found, keys: {list(data['data'].keys())[:15]}")
-                        actual_data = data["data"]
-                    else:
-                        logger.debug(f"Direct keys found (no nesting)")
-                        actual_data = data
-                    
-                    # Log author-related keys for debugging
-                    if "user" in actual_data:
-                        logger.debug(f"Has 'user' key with keys: {list(actual_data['user'].keys())[:10] if isinstance(actual_data['user'], dict) else 'not a dict'}")
-                    if "author" in actual_data:
-                        logger.debug(f"Has 'author' key: {actual_data['author']}")
-                    if "core" in actual_data:
-                        logger.debug(f"Has 'core' key")
-                    if "legacy" in actual_data:
-                        logger.debug(f"Has 'legacy' key")
-                        
-                    return self._format_twitter_content(actual_data, url)
-                elif response.status_code == 401:
-                    logger.error("ScrapeCreators: Invalid API key")
-                    return None
-                elif response.status_code == 402:
-                    logger.error("ScrapeCreators: Insufficient credits")
-                    return None
-                else:
-                    logger.error(f"ScrapeCreators API error: {response.status_code}")
-                    return None
-                    
         except httpx.TimeoutException:
-            logger.error(f"Timeout fetching Twitter content from ScrapeCreators")
+            logger.error(f"Timeout fetching {platform} content from ScrapeCreators")
             return None
         except Exception as e:
-            logger.error(f"Error fetching Twitter content from ScrapeCreators: {e}")
+            logger.error(f"Error fetching {platform} content from ScrapeCreators: {e}")
+            return None
+    
+    async def get_twitter_content(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch Twitter/X tweet content using ScrapeCreators API.
+        
+        Args:
+            url: Tweet URL (e.g., https://twitter.com/user/status/123456789)
+        
+        Returns:
+            Formatted content dict or None on error
+        """
+        logger.info(f"Fetching Twitter content via ScrapeCreators: {url}")
+        data = await self._get_json("/v1/twitter/tweet", {"url": url}, "Twitter")
+        if data is None:
             return None
+        
+        # Check if data has "data" key (nested) or direct keys
+        actual_data = data["data"] if "data" in data else data
+        
+        # Log the payload shape for debugging; the key listings are only
+        # built when DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            if actual_data is not data:
+                logger.debug(f"Nested 'data' found, keys: {list(actual_data.keys())[:15]}")
+            else:
+                logger.debug("Direct keys found (no nesting)")
+            if "user" in actual_data:
+                logger.debug(f"Has 'user' key with keys: {list(actual_data['user'].keys())[:10] if isinstance(actual_data['user'], dict) else 'not a dict'}")
+            if "author" in actual_data:
+                logger.debug(f"Has 'author' key: {actual_data['author']}")
+            if "core" in actual_data:
+                logger.debug("Has 'core' key")
+            if "legacy" in actual_data:
+                logger.debug("Has 'legacy' key")
+        
+        return self._format_twitter_content(actual_data, url)
     
     async def get_facebook_content(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -97,39 +315,9 @@ class ScrapeCreatorsService:
         Returns:
             Formatted content dict or None on error
         """
-        if not self.api_key:
-            logger.error("ScrapeCreators API key not configured")
-            return None
-        
-        try:
-            logger.info(f"Fetching Facebook content via ScrapeCreators: {url}")
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/v1/facebook/post",
-                    params={"url": url},
-                    headers={"x-api-key": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._format_facebook_content(data, url)
-                elif response.status_code == 401:
-                    logger.error("ScrapeCreators: Invalid API key")
-                    return None
-                elif response.status_code == 402:
-                    logger.error("ScrapeCreators: Insufficient credits")
-                    return None
-                else:
-                    logger.error(f"ScrapeCreators API error: {response.status_code}")
-                    return None
-                    
-        except httpx.TimeoutException:
-            logger.error(f"Timeout fetching Facebook content from ScrapeCreators")
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching Facebook content from ScrapeCreators: {e}")
-            return None
+        logger.info(f"Fetching Facebook content via ScrapeCreators: {url}")
+        data = await self._get_json("/v1/facebook/post", {"url": url}, "Facebook")
+        return self._format_facebook_content(data, url) if data is not None else None
     
     async def get_instagram_content(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -141,39 +329,40 @@ class ScrapeCreatorsService:
         Returns:
             Formatted content dict or None on error
         """
-        if not self.api_key:
-            logger.error("ScrapeCreators API key not configured")
-            return None
+        logger.info(f"Fetching Instagram content via ScrapeCreators: {url}")
+        data = await self._get_json("/v1/instagram/post", {"url": url}, "Instagram")
+        return self._format_instagram_content(data, url) if data is not None else None
+    
+    async def get_many(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several Twitter/Facebook/Instagram posts concurrently.
         
-        try:
-            logger.info(f"Fetching Instagram content via ScrapeCreators: {url}")
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/v1/instagram/post",
-                    params={"url": url},
-                    headers={"x-api-key": self.api_key}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._format_instagram_content(data, url)
-                elif response.status_code == 401:
-                    logger.error("ScrapeCreators: Invalid API key")
-                    return None
-                elif response.status_code == 402:
-                    logger.error("ScrapeCreators: Insufficient credits")
-                    return None
-                else:
-                    logger.error(f"ScrapeCreators API error: {response.status_code}")
-                    return None
-                    
-        except httpx.TimeoutException:
-            logger.error(f"Timeout fetching Instagram content from ScrapeCreators")
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching Instagram content from ScrapeCreators: {e}")
+        Requests share the pooled client and adaptive concurrency limit, so a
+        batch finishes in roughly the time of its slowest call.
+        
+        Args:
+            urls: Post URLs on any supported platform
+        
+        Returns:
+            Formatted content dicts in input order; None for unsupported URLs
+            and failed fetches
+        """
+        async def fetch(url: str) -> Optional[Dict[str, Any]]:
+            platform = _platform_of(url)
+            if platform == "twitter":
+                return await self.get_twitter_content(url)
+            if platform == "facebook":
+                return await self.get_facebook_content(url)
+            if platform == "instagram":
+                return await self.get_instagram_content(url)
+            logger.warning(f"Unsupported URL for ScrapeCreators: {url}")
             return None
+        
+        results = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {url} from ScrapeCreators: {result}")
+        return [None if isinstance(result, Exception) else result for result in results]
     
     def _format_twitter_content(self, data: Dict[str, Any], url: str) -> Dict[str, Any]:
         """
@@ -186,27 +375,31 @@ class ScrapeCreatorsService:
         Returns:
             Formatted content dict
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
             # Log the raw data structure for debugging
-            logger.debug(f"Raw ScrapeCreators Twitter data keys: {list(data.keys())}")
-            if "core" in data:
-                logger.debug(f"core keys: {list(data['core'].keys())}")
-            if "legacy" in data:
-                logger.debug(f"legacy keys: {list(data['legacy'].keys())[:10]}...")  # First 10 keys
+            if debug:
+                logger.debug(f"Raw ScrapeCreators Twitter data keys: {list(data.keys())}")
+                if "core" in data:
+                    logger.debug(f"core keys: {list(data['core'].keys())}")
+                if "legacy" in data:
+                    logger.debug(f"legacy keys: {list(data['legacy'].keys())[:10]}...")  # First 10 keys
             
             legacy = data.get("legacy", {})
             user_result = data.get("core", {}).get("user_results", {}).get("result", {})
             user_legacy = user_result.get("legacy", {})
             user_core = user_result.get("core", {})  # Name and screen_name are here!
             
-            logger.debug(f"user_legacy keys: {list(user_legacy.keys()) if user_legacy else 'EMPTY'}")
-            logger.debug(f"user_core keys: {list(user_core.keys()) if user_core else 'EMPTY'}")
+            if debug:
+                logger.debug(f"user_legacy keys: {list(user_legacy.keys()) if user_legacy else 'EMPTY'}")
+                logger.debug(f"user_core keys: {list(user_core.keys()) if user_core else 'EMPTY'}")
             
             # Extract tweet text
             text = legacy.get("full_text", "")
             
             # Extract media (images/videos)
             media = []
+            has_video = False
             entities = legacy.get("entities", {})
             extended_entities = legacy.get("extended_entities", {})
             
@@ -221,22 +414,27 @@ class ScrapeCreatorsService:
                 elif media_type == "video" or media_type == "animated_gif":
                     # Get highest quality video
                     video_variants = m.get("video_info", {}).get("variants", [])
-                    best_video = max(
-                        (v for v in video_variants if v.get("content_type") == "video/mp4"),
-                        key=lambda v: v.get("bitrate", 0),
-                        default=None
-                    )
+                    best_video = None
+                    best_bitrate = -1
+                    for v in video_variants:
+                        if v.get("content_type") == "video/mp4":
+                            bitrate = v.get("bitrate") or 0
+                            if bitrate > best_bitrate:
+                                best_bitrate = bitrate
+                                best_video = v
                     if best_video:
                         media.append({
                             "type": "video",
                             "url": best_video.get("url", ""),
                             "thumbnail": m.get("media_url_https", "")
                         })
+                        has_video = True
             
             # Log media extraction for debugging
-            logger.debug(f"Twitter media extracted: {len(media)} items")
-            for idx, m in enumerate(media):
-                logger.debug(f"  Media {idx+1}: type={m.get('type')}, url={'present' if m.get('url') else 'empty'}")
+            if debug:
+                logger.debug(f"Twitter media extracted: {len(media)} items")
+                for idx, m in enumerate(media):
+                    logger.debug(f"  Media {idx+1}: type={m.get('type')}, url={'present' if m.get('url') else 'empty'}")
             
             # Extract metrics
             metrics = {
@@ -266,7 +464,8 @@ class ScrapeCreatorsService:
             }
             
             # Log author data for debugging
-            logger.debug(f"Twitter author extracted: name={author['name']}, username={author['username']}, followers={author['followers']}")
+            if debug:
+                logger.debug(f"Twitter author extracted: name={author['name']}, username={author['username']}, followers={author['followers']}")
             
             # Extract timestamp
             created_at = legacy.get("created_at", "")
@@ -279,17 +478,19 @@ class ScrapeCreatorsService:
                 "platform": "twitter",
                 "tweet_id": tweet_id,
                 "url": url,
-                "content_type": "video" if any(m["type"] == "video" for m in media) else "text",
+                "content_type": "video" if has_video else "text",
                 "text": text,
                 "media": media,
                 "author": author,
                 "metrics": metrics,
                 "timestamp": timestamp,
-                "raw_data": data,
                 "scraper": "scrapecreators"
             }
+            # The full upstream payload is large; only attach it when asked to
+            if self.include_raw:
+                formatted["raw_data"] = data
             
-            logger.debug(f"Successfully formatted Twitter content from ScrapeCreators")
+            logger.debug("Successfully formatted Twitter content from ScrapeCreators")
             return formatted
             
         except Exception as e:
@@ -315,11 +516,13 @@ class ScrapeCreatorsService:
         Returns:
             Formatted content dict
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug(f"Formatting Facebook content from ScrapeCreators")
-            logger.debug(f"Has image_url: {bool(data.get('image_url'))}")
-            logger.debug(f"Has video: {bool(data.get('video', {}).get('hd_url') or data.get('video', {}).get('sd_url'))}")
-            logger.debug(f"Author data: {data.get('author', {})}")
+            logger.debug("Formatting Facebook content from ScrapeCreators")
+            if debug:
+                logger.debug(f"Has image_url: {bool(data.get('image_url'))}")
+                logger.debug(f"Has video: {bool(data.get('video', {}).get('hd_url') or data.get('video', {}).get('sd_url'))}")
+                logger.debug(f"Author data: {data.get('author', {})}")
             
             # Extract text content
             text = data.get("description", "")
@@ -361,7 +564,7 @@ class ScrapeCreatorsService:
             # Try to extract username from URL or use name as fallback
             if author_url:
                 # Extract username from URL (last part after /)
-                username = author_url.rstrip('/').split('/')[-1]
+                username = author_url.rstrip('/').rpartition('/')[2]
             else:
                 # Use name as username if no URL available
                 username = author_data.get("name", "unknown").replace(" ", "").lower()
@@ -392,13 +595,15 @@ class ScrapeCreatorsService:
                 "metrics": metrics,
                 "audio": audio_info,
                 "post_id": data.get("post_id", ""),
-                "raw_data": data,
                 "scraper": "scrapecreators"
             }
+            if self.include_raw:
+                formatted["raw_data"] = data
             
-            logger.debug(f"Facebook author: name={author['name']}, username={author['username']}, profile_image={'present' if author['profile_image'] else 'EMPTY'}")
-            logger.debug(f"Facebook media: {len(media)} items, content_type={formatted['content_type']}")
-            logger.debug(f"Successfully formatted Facebook content from ScrapeCreators")
+            if debug:
+                logger.debug(f"Facebook author: name={author['name']}, username={author['username']}, profile_image={'present' if author['profile_image'] else 'EMPTY'}")
+                logger.debug(f"Facebook media: {len(media)} items, content_type={formatted['content_type']}")
+            logger.debug("Successfully formatted Facebook content from ScrapeCreators")
             return formatted
             
         except Exception as e:
@@ -423,19 +628,22 @@ class ScrapeCreatorsService:
         Returns:
             Formatted content dict
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug(f"Formatting Instagram content from ScrapeCreators")
-            media_data = data.get("data", {}).get("xdt_shortcode_media", {})
-            logger.debug(f"Has media_data: {bool(media_data)}")
+            logger.debug("Formatting Instagram content from ScrapeCreators")
+            media_data = _dig(data, "data", "xdt_shortcode_media") or {}
+            if debug:
+                logger.debug(f"Has media_data: {bool(media_data)}")
             
             # Extract text content
-            caption_edges = media_data.get("edge_media_to_caption", {}).get("edges", [])
+            caption_edges = _dig(media_data, "edge_media_to_caption", "edges")
             text = caption_edges[0]["node"]["text"] if caption_edges else ""
             
             # Determine content type
             typename = media_data.get("__typename", "")
             is_video = typename == "XDTGraphVideo" or media_data.get("is_video", False)
-            logger.debug(f"Content type: {typename}, is_video: {is_video}")
+            if debug:
+                logger.debug(f"Content type: {typename}, is_video: {is_video}")
             
             # Extract media
             media = []
@@ -452,13 +660,12 @@ class ScrapeCreatorsService:
                 })
             else:
                 # Check for carousel (multiple images)
-                carousel = media_data.get("edge_sidecar_to_children", {}).get("edges", [])
+                carousel = _dig(media_data, "edge_sidecar_to_children", "edges")
                 if carousel:
                     for item in carousel:
-                        node = item.get("node", {})
                         media.append({
                             "type": "image",
-                            "url": node.get("display_url", "")
+                            "url": _dig(item, "node", "display_url", default="")
                         })
                 else:
                     # Single image
@@ -468,18 +675,20 @@ class ScrapeCreatorsService:
                             "type": "image",
                             "url": display_url
                         })
-                        logger.debug(f"Added single image: {len(display_url)} chars")
+                        if debug:
+                            logger.debug(f"Added single image: {len(display_url)} chars")
             
             # Extract metrics
             metrics = {
-                "likes": media_data.get("edge_media_preview_like", {}).get("count", 0),
-                "comments": media_data.get("edge_media_to_parent_comment", {}).get("count", 0),
+                "likes": _dig(media_data, "edge_media_preview_like", "count", default=0),
+                "comments": _dig(media_data, "edge_media_to_parent_comment", "count", default=0),
                 "views": media_data.get("video_play_count", 0) if is_video else 0
             }
             
             # Extract author info
             owner = media_data.get("owner", {})
-            logger.debug(f"Owner data: username={owner.get('username')}, full_name={owner.get('full_name')}, has_profile_pic={bool(owner.get('profile_pic_url'))}")
+            if debug:
+                logger.debug(f"Owner data: username={owner.get('username')}, full_name={owner.get('full_name')}, has_profile_pic={bool(owner.get('profile_pic_url'))}")
             
             # For Instagram: Display username as name, and full_name as username (swapped for UI display)
             author = {
@@ -487,15 +696,16 @@ class ScrapeCreatorsService:
                 "username": owner.get("full_name", "unknown"),  # Show full_name as the handle
                 "profile_image": owner.get("profile_pic_url", ""),
                 "verified": owner.get("is_verified", False),
-                "followers": owner.get("edge_followed_by", {}).get("count", 0)
+                "followers": _dig(owner, "edge_followed_by", "count", default=0)
             }
             
-            logger.debug(f"Instagram author: name={author['name']}, username={author['username']}, profile_image={'present ('+str(len(author['profile_image']))+' chars)' if author['profile_image'] else 'EMPTY'}")
-            logger.debug(f"Instagram media: {len(media)} items, content_type={'video' if is_video else 'image'}")
+            if debug:
+                logger.debug(f"Instagram author: name={author['name']}, username={author['username']}, profile_image={'present ('+str(len(author['profile_image']))+' chars)' if author['profile_image'] else 'EMPTY'}")
+                logger.debug(f"Instagram media: {len(media)} items, content_type={'video' if is_video else 'image'}")
             
             # Extract timestamp
             timestamp_unix = media_data.get("taken_at_timestamp")
-            timestamp = datetime.fromtimestamp(timestamp_unix).isoformat() if timestamp_unix else None
+            timestamp = datetime.fromtimestamp(timestamp_unix, tz=timezone.utc).isoformat() if timestamp_unix else None
             
             # Extract audio/music info
             clips_music = media_data.get("clips_music_attribution_info", {})
@@ -517,11 +727,12 @@ class ScrapeCreatorsService:
                 "audio": audio_info,
                 "timestamp": timestamp,
                 "shortcode": media_data.get("shortcode", ""),
-                "raw_data": data,
                 "scraper": "scrapecreators"
             }
+            if self.include_raw:
+                formatted["raw_data"] = data
             
-            logger.debug(f"Successfully formatted Instagram content from ScrapeCreators")
+            logger.debug("Successfully formatted Instagram content from ScrapeCreators")
             return formatted
             
         except Exception as e:
@@ -546,8 +757,7 @@ class ScrapeCreatorsService:
             ISO 8601 formatted timestamp or None
         """
         try:
-            dt = datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y")
-            return dt.isoformat()
+            return _twitter_timestamp_to_iso(created_at)
         except Exception as e:
             logger.warning(f"Failed to parse Twitter timestamp '{created_at}': {e}")
             return None
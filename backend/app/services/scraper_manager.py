@@ -4,29 +4,275 @@ Scraper manager for async web scraping with retry logic and rate limiting.
 
 import httpx
 import asyncio
+import functools
 import random
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin, urlparse
+import re
+import socket
+import time
+from types import MappingProxyType
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 from datetime import datetime
 from loguru import logger
 
 from app.models import SourceConfig, ArticleContent
 from app.utils.rate_limiter import rate_limiter
+from app.utils.retry import RETRYABLE_STATUS_CODES, backoff_delay, retry_after_seconds
 from app.utils.robots_checker import robots_checker
 from app.services.content_extractor import ContentExtractor
 from app.settings import settings
 
+# Optional: HTTP/2 support for httpx (multiplexes fetches to one host)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Optional: brotli decoding; without it httpx cannot decode 'br' bodies
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=4096)
+def _domain_of(url: str) -> str:
+    """
+    Extract the netloc (host[:port]) from a URL.
+    
+    Plain http(s) URLs are sliced directly; anything else goes through
+    urlparse so the result always matches urlparse(url).netloc.
+    
+    Args:
+        url: URL to extract the domain from
+    
+    Returns:
+        The URL's netloc
+    """
+    if url.startswith(('https://', 'http://')) and not any(c in url for c in '\t\r\n'):
+        start = url.index('://') + 3
+        end = len(url)
+        for sep in '/?#':
+            i = url.find(sep, start, end)
+            if i != -1:
+                end = i
+        return url[start:end]
+    return urlparse(url).netloc
+
+
+@functools.lru_cache(maxsize=256)
+def _origin_of(base_url: str) -> str:
+    """Get the scheme://host[:port] origin of a source's base URL."""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _absolute_url(base_url: str, url: str) -> str:
+    """
+    Resolve a root-relative link ('/path') against a source's base URL.
+    
+    Plain '/path' links are appended to the cached origin; protocol-relative
+    links and paths with dot segments go through urljoin.
+    
+    Args:
+        base_url: Source base URL
+        url: Link starting with '/'
+    
+    Returns:
+        Absolute URL
+    """
+    if url.startswith('//') or '/.' in url:
+        return urljoin(base_url, url)
+    return _origin_of(base_url) + url
+
+
+@functools.lru_cache(maxsize=256)
+def _build_search_url(template: str, query: str) -> str:
+    """
+    Fill a source's search URL template with the query.
+    
+    Args:
+        template: URL template with a {query} placeholder
+        query: Search query
+    
+    Returns:
+        Search URL
+    """
+    return template.format(query=query)
+
+
+# Letters, digits, whitespace and sentence punctuation; counted in C by
+# findall instead of testing each character in Python (\w minus "_" is
+# exactly str.isalnum)
+_READABLE_RE = re.compile(r'[^\W_]|[\s.,!?;:()"\'-]')
+
+
+# Statuses that say the page itself is unavailable; expected for some search
+# hits, so they are not worth a warning or a domain back-off
+_PERMANENT_STATUS_CODES = frozenset({400, 401, 403, 404, 410, 451})
+
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = frozenset({
+    'gclid', 'fbclid', 'dclid', 'msclkid', 'yclid', 'mc_cid', 'mc_eid', 'igshid', 'ref_src'
+})
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection.
+    
+    Drops the fragment and tracking parameters (utm_*, gclid, fbclid, ...)
+    and lowercases the scheme and host.
+    
+    Args:
+        url: URL to normalize
+    
+    Returns:
+        Canonical form of the URL
+    """
+    parts = urlsplit(url)
+    query = parts.query
+    if query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith('utm_') and key not in _TRACKING_PARAMS
+        ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """
+    Drop URLs whose canonical form was already seen, keeping the first.
+    
+    Args:
+        urls: URLs in priority order
+    
+    Returns:
+        The unique URLs, in their original order and spelling
+    """
+    seen = set()
+    unique = []
+    for url in urls:
+        canonical = _canonical_url(url)
+        if canonical not in seen:
+            seen.add(canonical)
+            unique.append(url)
+    return unique
+
+
+def _printable_ratio(text: str, limit: int = 1000) -> float:
+    """
+    Share of printable or whitespace characters in the start of a text.
+    
+    Clean pages take a C-level fast path (strip whitespace, one isprintable
+    call); only pages with control or unassigned characters are counted
+    character by character.
+    
+    Args:
+        text: Decoded text to check
+        limit: Number of leading characters to sample
+    
+    Returns:
+        Ratio between 0.0 and 1.0 (0.0 for empty text)
+    """
+    sample = text[:limit]
+    if not sample:
+        return 0.0
+    if ''.join(sample.split()).isprintable():
+        return 1.0
+    return sum(c.isprintable() or c.isspace() for c in sample) / len(sample)
+
+
+class _Throttled:
+    """
+    Wrap a cancellation callback so it is polled at most once per interval.
+    
+    Between polls the last answer is reused. Cancellation is final, so once
+    the callback returns True it is not called again.
+    """
+    
+    def __init__(self, check: Callable[[], bool], min_interval: float = 0.5):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            check: Callback returning True if the operation should be cancelled
+            min_interval: Seconds to reuse an answer before polling again
+        """
+        self._check = check
+        self._min_interval = min_interval
+        self._cancelled = False
+        self._next_poll = 0.0
+    
+    def __call__(self) -> bool:
+        if self._cancelled:
+            return True
+        now = time.monotonic()
+        if now >= self._next_poll:
+            self._cancelled = bool(self._check())
+            self._next_poll = now + self._min_interval
+        return self._cancelled
+
 
 class ScraperManager:
     """
     Manages web scraping operations with async support, retries, and rate limiting.
     """
     
+    # Multiple User-Agents for rotation (avoid detection)
+    USER_AGENTS = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.2 Safari/605.1.15',
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+    )
+    
+    # Enhanced headers to mimic real browser more closely (read-only; the
+    # User-Agent is rotated per request in _merge_headers)
+    DEFAULT_HEADERS = MappingProxyType({
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0',
+        'DNT': '1'
+    })
+    
+    # Upper bound on a fetched page body; larger pages are truncated
+    MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+    
+    # Pages at least this long are extracted in a worker thread; smaller ones
+    # are cheaper to parse inline than to hand off
+    OFFLOAD_MIN_HTML_CHARS = 20000
+    
+    # Encodings tried when detection on the raw bytes gives unreadable text
+    FALLBACK_ENCODINGS = ('utf_8', 'cp1252', 'latin_1')
+    
+    # Article fetches kept in flight per article still needed; raise it for
+    # sources where many links fail to yield an article
+    OVERFETCH_RATIO = 2
+    
+    # Seconds between polls of a scrape's cancellation_check, which may hit
+    # the session store
+    CANCEL_POLL_INTERVAL = 0.5
+    
     def __init__(
         self,
         timeout: float = 30.0,
         max_retries: int = 3,
-        follow_redirects: bool = True
+        follow_redirects: bool = True,
+        concurrency: int = 8,
+        burst: int = 3,
+        known_hosts: Optional[List[str]] = None
     ):
         """
         Initialize the scraper manager.
@@ -35,47 +281,80 @@ class ScraperManager:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             follow_redirects: Whether to follow HTTP redirects
+            concurrency: Maximum articles fetched at once per source
+            burst: Requests per domain allowed back to back before rate limiting spaces them out
+            known_hosts: Hostnames resolved ahead of time by warmup()
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.follow_redirects = follow_redirects
+        self.concurrency = concurrency
+        self.burst = burst
         self.content_extractor = ContentExtractor()
+        self._http: Optional[httpx.AsyncClient] = None
+        self._user_agent_index = 0  # Next entry of USER_AGENTS to send
+        self.known_hosts = list(known_hosts or [])
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client shared by all fetches."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=self.follow_redirects,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0)
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the pooled HTTP client (call on application shutdown)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def warmup(self, known_hosts: Optional[List[str]] = None) -> int:
+        """
+        Resolve source hostnames once at startup to prime the resolver cache.
         
-        # Multiple User-Agents for rotation (avoid detection)
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:133.0) Gecko/20100101 Firefox/133.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.2 Safari/605.1.15',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        ]
-        self._user_agent_index = 0
-        
-        # Enhanced headers to mimic real browser more closely
-        self.default_headers = {
-            'User-Agent': self.user_agents[0],  # Will rotate on each request
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'DNT': '1'
-        }
+        The addresses are not kept in-process: httpx resolves again on every
+        new connection, so this only helps when the OS or upstream resolver
+        (nscd, systemd-resolved, the network's DNS server) caches the answer.
+        Lookups run in parallel in the default executor; failures are ignored.
+        
+        Args:
+            known_hosts: Hostnames to resolve (defaults to self.known_hosts)
+        
+        Returns:
+            Number of hosts resolved
+        """
+        hosts = list(dict.fromkeys(known_hosts if known_hosts is not None else self.known_hosts))
+        if not hosts:
+            return 0
+        
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(None, socket.getaddrinfo, host, 443, 0, socket.SOCK_STREAM)
+            for host in hosts
+        ], return_exceptions=True)
+        
+        resolved = sum(1 for result in results if not isinstance(result, Exception))
+        logger.debug(f"DNS warmup resolved {resolved}/{len(hosts)} hosts")
+        return resolved
+    
+    async def __aenter__(self) -> "ScraperManager":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        parsed = urlparse(url)
-        return parsed.netloc
+        return _domain_of(url)
     
     def _get_rotated_user_agent(self) -> str:
         """Get next User-Agent in rotation to avoid detection."""
-        user_agent = self.user_agents[self._user_agent_index]
-        self._user_agent_index = (self._user_agent_index + 1) % len(self.user_agents)
+        user_agent = self.USER_AGENTS[self._user_agent_index]
+        self._user_agent_index = (self._user_agent_index + 1) % len(self.USER_AGENTS)
         return user_agent
     
     def _merge_headers(self, custom_headers: Optional[Dict[str, str]] = None, skip_referer: bool = False, minimal: bool = False) -> Dict[str, str]:
@@ -95,9 +374,8 @@ class ScraperManager:
                 'User-Agent': self._get_rotated_user_agent()
             }
         else:
-            headers = self.default_headers.copy()
             # Rotate User-Agent for each request
-            headers['User-Agent'] = self._get_rotated_user_agent()
+            headers = {'User-Agent': self._get_rotated_user_agent(), **self.DEFAULT_HEADERS}
             # Add Referer header to appear more legitimate (skip for certain requests like POST to DuckDuckGo)
             if not skip_referer:
                 headers['Referer'] = 'https://www.google.com/'
@@ -132,16 +410,15 @@ class ScraperManager:
         if respect_robots is None:
             respect_robots = settings.scraper_respect_robots
         
-        # Check robots.txt compliance
-        if respect_robots and not robots_checker.can_fetch(url):
-            logger.warning(f"Skipping {url} - disallowed by robots.txt")
-            return None
-        
-        # Get crawl delay from robots.txt if specified
+        # Check robots.txt compliance and crawl delay (one cached lookup; a
+        # robots.txt download on a miss runs off the event loop)
         if respect_robots:
-            robots_delay = robots_checker.get_crawl_delay(url)
-            if robots_delay and robots_delay > rate_limit:
-                logger.debug(f"Using robots.txt crawl delay of {robots_delay}s instead of {rate_limit}s")
+            allowed, robots_delay = await robots_checker.check_async(url)
+            if not allowed:
+                logger.warning(f"Skipping {url} - disallowed by robots.txt")
+                return None
+            if robots_delay is not None and robots_delay > rate_limit:
+                logger.debug("Using robots.txt crawl delay of {}s instead of {}s", robots_delay, rate_limit)
                 rate_limit = robots_delay
         
         domain = self._get_domain(url)
@@ -150,26 +427,26 @@ class ScraperManager:
         merged_headers = self._merge_headers(headers, skip_referer=is_post, minimal=is_post)
         
         # Apply rate limiting with small random jitter (more human-like)
-        await rate_limiter.wait_if_needed(domain, rate_limit)
+        await rate_limiter.wait_if_needed(domain, rate_limit, burst=self.burst)
         jitter = random.uniform(0.1, 0.5)  # Add 100-500ms random delay
         await asyncio.sleep(jitter)
         
         # Single attempt only - no retries to avoid wasting time
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=self.follow_redirects
-            ) as client:
-                logger.debug(f"Fetching {url} via {method}")
-                
-                # Choose GET or POST based on method parameter
-                if method.upper() == "POST" and data:
-                    logger.info(f"[POST-DEBUG] Making POST to {url} with data={data}, headers={merged_headers}")
-                    response = await client.post(url, data=data, headers=merged_headers)
-                    logger.info(f"[POST-DEBUG] Response status={response.status_code}, length={len(response.content)}, url={response.url}")
-                else:
-                    response = await client.get(url, headers=merged_headers)
-                
+            client = self._get_http()
+            logger.debug("Fetching {} via {}", url, method)
+            
+            # Choose GET or POST based on method parameter
+            if method.upper() == "POST" and data:
+                logger.info(f"[POST-DEBUG] Making POST to {url} with data={data}, headers={merged_headers}")
+                request = client.build_request("POST", url, data=data, headers=merged_headers)
+            else:
+                request = client.build_request("GET", url, headers=merged_headers)
+            
+            # Stream the body so error pages and binary files are never
+            # downloaded, and oversized pages are cut off at the cap
+            response = await client.send(request, stream=True)
+            try:
                 response.raise_for_status()
                 
                 # Handle encoding properly - detect from Content-Type header or response
@@ -180,102 +457,119 @@ class ScraperManager:
                     logger.warning(f"Non-text content type '{content_type}' for {url}")
                     return None
                 
-                # Try to decode with proper charset detection
+                content = await self._read_body(response)
+            finally:
+                await response.aclose()
+            
+            if method.upper() == "POST" and data:
+                logger.info(f"[POST-DEBUG] Response status={response.status_code}, length={len(content)}, url={response.url}")
+            
+            # Try to decode with proper charset detection
+            try:
+                # First decode with the declared charset (UTF-8 if none), as httpx would
                 try:
-                    # First try httpx's auto-detection
-                    text = response.text
+                    text = content.decode(response.charset_encoding or 'utf-8', errors='replace')
+                except LookupError:
+                    text = content.decode('utf-8', errors='replace')
+                
+                # Validate it's actually readable text (not binary garbage)
+                if len(text) > 100:
+                    printable_ratio = _printable_ratio(text)
                     
-                    # Validate it's actually readable text (not binary garbage)
-                    if len(text) > 100:
-                        printable_count = sum(c.isprintable() or c.isspace() for c in text[:1000])
-                        printable_ratio = printable_count / min(1000, len(text))
+                    # If less than 85% printable, try alternative decoding
+                    if printable_ratio < 0.85:
+                        logger.warning(f"Initial decode quality low ({printable_ratio:.1%}) for {url}, trying alternative encodings")
                         
-                        # If less than 85% printable, try alternative decoding
-                        if printable_ratio < 0.85:
-                            logger.warning(f"Initial decode quality low ({printable_ratio:.1%}) for {url}, trying alternative encodings")
-                            
-                            best_text = text
-                            best_ratio = printable_ratio
-                            best_encoding = 'httpx-auto'
+                        best_text = text
+                        best_ratio = printable_ratio
+                        best_encoding = 'httpx-auto'
+                        
+                        # First, try charset-normalizer for intelligent detection
+                        try:
+                            from charset_normalizer import from_bytes
                             
-                            # First, try charset-normalizer for intelligent detection
+                            # Let charset-normalizer analyze the raw bytes
+                            results = from_bytes(content)
+                            if results:
+                                best_match = results.best()
+                                if best_match and best_match.encoding:
+                                    detected_text = str(best_match)
+                                    detected_ratio = _printable_ratio(detected_text)
+                                    
+                                    logger.info(f"charset-normalizer detected: {best_match.encoding} ({detected_ratio:.1%} readable, coherence: {best_match.coherence:.0%})")
+                                    
+                                    if detected_ratio > best_ratio:
+                                        best_text = detected_text
+                                        best_ratio = detected_ratio
+                                        best_encoding = f'charset-normalizer:{best_match.encoding}'
+                        except ImportError:
+                            logger.debug("charset-normalizer not available, using fallback encoding detection")
+                        except Exception as e:
+                            logger.debug(f"charset-normalizer failed: {e}, using fallback")
+                        
+                        # Fallback: let charset-normalizer pick among the common
+                        # Western encodings (one pass over the bytes instead of
+                        # decoding and scoring each candidate here)
+                        if best_ratio < 0.70:  # Only if charset-normalizer didn't help enough
                             try:
                                 from charset_normalizer import from_bytes
                                 
-                                # Let charset-normalizer analyze the raw bytes
-                                results = from_bytes(response.content)
-                                if results:
-                                    best_match = results.best()
-                                    if best_match and best_match.encoding:
-                                        detected_text = str(best_match)
-                                        detected_printable = sum(c.isprintable() or c.isspace() for c in detected_text[:1000])
-                                        detected_ratio = detected_printable / min(1000, len(detected_text))
-                                        
-                                        logger.info(f"charset-normalizer detected: {best_match.encoding} ({detected_ratio:.1%} readable, confidence: {best_match.encoding_confidence:.0%})")
-                                        
-                                        if detected_ratio > best_ratio:
-                                            best_text = detected_text
-                                            best_ratio = detected_ratio
-                                            best_encoding = f'charset-normalizer:{best_match.encoding}'
+                                fallback_match = from_bytes(content, cp_isolation=self.FALLBACK_ENCODINGS).best()
+                                if fallback_match and fallback_match.encoding:
+                                    alt_text = str(fallback_match).replace('\ufffd', '')
+                                    alt_ratio = _printable_ratio(alt_text)
+                                    logger.debug("  Fallback {}: {:.1%} readable", fallback_match.encoding, alt_ratio)
+                                    
+                                    if alt_ratio > best_ratio:
+                                        best_text = alt_text
+                                        best_ratio = alt_ratio
+                                        best_encoding = fallback_match.encoding
                             except ImportError:
-                                logger.debug("charset-normalizer not available, using fallback encoding detection")
+                                pass
                             except Exception as e:
-                                logger.debug(f"charset-normalizer failed: {e}, using fallback")
-                            
-                            # Fallback: Try common encodings manually
-                            if best_ratio < 0.70:  # Only if charset-normalizer didn't help enough
-                                for encoding in ['utf-8', 'iso-8859-1', 'windows-1252', 'latin-1', 'cp1252']:
-                                    try:
-                                        alt_text = response.content.decode(encoding, errors='replace')
-                                        alt_text = alt_text.replace('�', '')
-                                        
-                                        alt_printable = sum(c.isprintable() or c.isspace() for c in alt_text[:1000])
-                                        alt_ratio = alt_printable / min(1000, len(alt_text))
-                                        
-                                        logger.debug(f"  Tried {encoding}: {alt_ratio:.1%} readable")
-                                        
-                                        if alt_ratio > best_ratio:
-                                            best_text = alt_text
-                                            best_ratio = alt_ratio
-                                            best_encoding = encoding
-                                        
-                                        if alt_ratio > 0.95:
-                                            logger.info(f"Excellent decode with {encoding} ({alt_ratio:.1%} readable)")
-                                            text = alt_text
-                                            break
-                                    except (UnicodeDecodeError, AttributeError) as e:
-                                        logger.debug(f"  {encoding} failed: {e}")
-                                        continue
-                            
-                            # Use best encoding found
-                            if best_ratio > 0.30:  # Accept content above 30% readable
-                                if best_ratio < printable_ratio:
-                                    # Don't downgrade if original was better
-                                    logger.info(f"Keeping original httpx decode ({printable_ratio:.1%}) - better than alternatives")
-                                else:
-                                    logger.info(f"Using {best_encoding} encoding ({best_ratio:.1%} readable)")
-                                    text = best_text
-                                    
-                                    # Additional aggressive cleaning for low-quality content
-                                    if best_ratio < 0.60:
-                                        text = text.replace('\x00', '')  # NULL bytes
-                                        text = text.replace('\ufffd', '')  # Replacement character
-                                        text = ''.join(c for c in text if ord(c) < 0x10000)  # Remove high Unicode
-                                        logger.debug(f"Applied aggressive cleaning for low-quality content")
+                                logger.debug(f"charset-normalizer fallback failed: {e}")
+                        
+                        # Use best encoding found
+                        if best_ratio > 0.30:  # Accept content above 30% readable
+                            if best_ratio < printable_ratio:
+                                # Don't downgrade if original was better
+                                logger.info(f"Keeping original httpx decode ({printable_ratio:.1%}) - better than alternatives")
                             else:
-                                # Content is truly unrecoverable (<30% readable)
-                                logger.error(f"All encodings failed for {url} (best: {best_encoding} at {best_ratio:.1%}) - likely binary content")
-                                return None
-                    
-                    logger.info(f"Successfully fetched {url} ({len(text)} chars)")
-                    return text
-                except UnicodeDecodeError as e:
-                    logger.error(f"Encoding error for {url}: {e}")
-                    return None
+                                logger.info(f"Using {best_encoding} encoding ({best_ratio:.1%} readable)")
+                                text = best_text
+                                
+                                # Additional aggressive cleaning for low-quality content
+                                if best_ratio < 0.60:
+                                    text = text.replace('\x00', '')  # NULL bytes
+                                    text = text.replace('\ufffd', '')  # Replacement character
+                                    text = ''.join(c for c in text if ord(c) < 0x10000)  # Remove high Unicode
+                                    logger.debug("Applied aggressive cleaning for low-quality content")
+                        else:
+                            # Content is truly unrecoverable (<30% readable)
+                            logger.error(f"All encodings failed for {url} (best: {best_encoding} at {best_ratio:.1%}) - likely binary content")
+                            return None
                 
+                logger.debug("Successfully fetched {} ({} chars)", url, len(text))
+                return text
+            except UnicodeDecodeError as e:
+                logger.error(f"Encoding error for {url}: {e}")
+                return None
+            
         except httpx.HTTPStatusError as e:
             status_code = e.response.status_code
-            logger.warning(f"HTTP error {status_code} for {url}")
+            if status_code in _PERMANENT_STATUS_CODES:
+                logger.debug("HTTP error {} for {}", status_code, url)
+            else:
+                logger.warning(f"HTTP error {status_code} for {url}")
+            if status_code in RETRYABLE_STATUS_CODES:
+                # Honor the server's Retry-After so the next fetch from this
+                # domain (e.g. the remaining articles) backs off instead of
+                # piling on; a bare 429 still earns a short back-off
+                retry_after = retry_after_seconds(e)
+                if retry_after is None and status_code == 429:
+                    retry_after = backoff_delay(0)
+                if retry_after:
+                    rate_limiter.defer(domain, retry_after)
             return None
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching {url} - skipping")
@@ -284,6 +578,48 @@ class ScraperManager:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
+    async def _read_body(self, response: httpx.Response) -> bytes:
+        """
+        Read a streamed response body, keeping at most MAX_RESPONSE_BYTES.
+        
+        Args:
+            response: Streamed httpx response
+        
+        Returns:
+            The (possibly truncated) decompressed body
+        """
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > self.MAX_RESPONSE_BYTES:
+                logger.warning(f"Response from {response.url} exceeds {self.MAX_RESPONSE_BYTES} bytes, truncating")
+                del body[self.MAX_RESPONSE_BYTES:]
+                break
+        return bytes(body)
+    
+    def _extract_article(self, html: str, selectors: Dict[str, str]) -> Tuple[Dict[str, Any], str, str]:
+        """
+        Extract and clean an article's fields from its HTML.
+        
+        Args:
+            html: Article HTML
+            selectors: Source CSS selectors (generic extraction if empty)
+        
+        Returns:
+            Tuple of (extracted fields, cleaned title, cleaned content)
+        """
+        # Extract content using selectors
+        if selectors:
+            extracted = self.content_extractor.extract_with_selectors(html, selectors)
+        else:
+            # Fallback to generic extraction
+            extracted = self.content_extractor.extract_generic(html)
+        
+        # Clean the content
+        title = self.content_extractor.clean_text(extracted.get('title', ''))
+        content = self.content_extractor.clean_text(extracted.get('content', ''))
+        return extracted, title, content
+    
     async def scrape_article(
         self,
         url: str,
@@ -302,7 +638,7 @@ class ScraperManager:
         try:
             # Make URL absolute if relative
             if url.startswith('/'):
-                url = urljoin(source_config.base_url, url)
+                url = _absolute_url(source_config.base_url, url)
             
             # Fetch HTML
             html = await self.fetch_url(
@@ -316,32 +652,28 @@ class ScraperManager:
             
             # Log HTML quality (but don't reject - we'll try to extract what we can)
             if len(html) > 100:
-                sample = html[:1000]
-                printable = sum(c.isprintable() or c.isspace() for c in sample)
-                ratio = printable / len(sample)
+                ratio = _printable_ratio(html)
                 if ratio < 0.70:
                     logger.warning(f"HTML quality low for {url} (readable: {ratio:.1%}) - will try to extract usable content")
             
-            # Extract content using selectors
-            if source_config.selectors:
-                extracted = self.content_extractor.extract_with_selectors(
-                    html,
-                    source_config.selectors
+            # Extraction is CPU-bound; parse large pages in a worker thread so
+            # the other in-flight fetches are not stalled meanwhile
+            if len(html) >= self.OFFLOAD_MIN_HTML_CHARS:
+                extracted, title, content = await asyncio.get_running_loop().run_in_executor(
+                    None, self._extract_article, html, source_config.selectors
                 )
             else:
-                # Fallback to generic extraction
-                extracted = self.content_extractor.extract_generic(html)
-            
-            # Clean the content
-            title = self.content_extractor.clean_text(extracted.get('title', ''))
-            content = self.content_extractor.clean_text(extracted.get('content', ''))
+                extracted, title, content = self._extract_article(html, source_config.selectors)
             
-            # Log content quality before validation
+            # Log content quality before validation (only computed when a
+            # sink accepts DEBUG)
             if content:
                 sample = content[:500]
-                readable = sum(c.isalnum() or c.isspace() or c in '.,!?;:()-"\'' for c in sample)
-                ratio = readable / len(sample) if len(sample) > 0 else 0
-                logger.info(f"Content quality after cleaning: {ratio:.1%} readable (sample: {sample[:100]!r})")
+                logger.opt(lazy=True).debug(
+                    "Content quality after cleaning: {:.1%} readable (sample: {!r})",
+                    lambda: len(_READABLE_RE.findall(sample)) / len(sample),
+                    lambda: sample[:100]
+                )
             
             # Validate content
             if not self.content_extractor.is_valid_content(content):
@@ -362,7 +694,7 @@ class ScraperManager:
                 source_name=source_config.name
             )
             
-            logger.info(f"Successfully scraped article from {url}")
+            logger.debug("Successfully scraped article from {}", url)
             return article
             
         except Exception as e:
@@ -416,93 +748,150 @@ class ScraperManager:
             
             logger.info(f"Fetching Google Custom Search: '{query}' (target: {max_results} results, {num_requests} API calls)")
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                for page in range(num_requests):
-                    # Check if we have enough results
-                    if len(all_urls) >= max_results:
-                        break
-                    
-                    start_index = page * 10 + 1
-                    results_per_request = min(10, max_results - len(all_urls) + filtered_count)  # Request extra to account for filtering
-                    
-                    params = {
-                        'key': settings.google_cse_api_key,
-                        'cx': settings.google_cse_id,
-                        'q': query,
-                        'num': min(results_per_request, 10),  # Google's hard limit
-                        'start': start_index
-                    }
-                    
-                    try:
-                        response = await client.get(
-                            "https://www.googleapis.com/customsearch/v1",
-                            params=params,
-                            timeout=10.0
-                        )
-                        response.raise_for_status()
-                        data = response.json()
-                        
-                    except httpx.TimeoutException:
-                        logger.warning(f"Google API timeout on page {page + 1}, continuing with {len(all_urls)} results")
-                        break
-                    except httpx.HTTPStatusError as e:
-                        if e.response.status_code == 429:
-                            logger.error("Google API rate limit exceeded")
-                        else:
-                            logger.error(f"Google API HTTP {e.response.status_code}: {e.response.text[:200]}")
-                        break
+            client = self._get_http()
+            
+            async def fetch_page(page: int) -> Tuple[Optional[Dict[str, Any]], bool]:
+                """Fetch one result page; returns (data or None, rate limited)."""
+                params = {
+                    'key': settings.google_cse_api_key,
+                    'cx': settings.google_cse_id,
+                    'q': query,
+                    'num': 10,  # Google's hard limit; extra results make up for filtering
+                    'start': page * 10 + 1
+                }
+                try:
+                    response = await client.get(
+                        "https://www.googleapis.com/customsearch/v1",
+                        params=params,
+                        timeout=10.0
+                    )
+                    response.raise_for_status()
+                    return response.json(), False
+                except httpx.TimeoutException:
+                    logger.warning(f"Google API timeout on page {page + 1}")
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code == 429:
+                        logger.error("Google API rate limit exceeded")
+                        return None, True
+                    logger.error(f"Google API HTTP {e.response.status_code}: {e.response.text[:200]}")
+                return None, False
+            
+            # Every call is billed, so fetch page 1 first and only request the
+            # further pages its result count says exist
+            first_page, _ = await fetch_page(0)
+            pages: List[Optional[Dict[str, Any]]] = [first_page]
+            available = self._google_pages_available(first_page, num_requests)
+            
+            if available > 1:
+                # Page offsets are fixed, so the remaining pages go out at once
+                # and are merged in order afterwards
+                tasks = {asyncio.ensure_future(fetch_page(page)): page for page in range(1, available)}
+                results: Dict[int, Optional[Dict[str, Any]]] = {}
+                pending = set(tasks)
+                try:
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            page = tasks[task]
+                            data, rate_limited = task.result()
+                            results[page] = data
+                            if rate_limited:
+                                # Further calls would only be rejected (and billed)
+                                stop = set(pending)
+                            elif data is None:
+                                # Merging stops at a failed page; later ones are unused
+                                stop = {t for t in pending if tasks[t] > page}
+                            else:
+                                continue
+                            for stopped in stop:
+                                stopped.cancel()
+                            pending -= stop
+                finally:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                pages.extend(results.get(page) for page in range(1, available))
+            
+            for page, data in enumerate(pages):
+                # Stop at the first failed page, as later pages cannot be trusted
+                # to continue the same ranking
+                if data is None:
+                    logger.warning(f"Google API page {page + 1} failed, continuing with {len(all_urls)} results")
+                    break
+                
+                # Check if results exist
+                if 'items' not in data or not data['items']:
+                    logger.debug(f"No more results after {total_fetched} fetched")
+                    break
+                
+                items = data['items']
+                total_fetched += len(items)
+                
+                # Extract and filter URLs
+                for item in items:
+                    if 'link' not in item:
+                        continue
                     
-                    # Check if results exist
-                    if 'items' not in data or not data['items']:
-                        logger.debug(f"No more results after {total_fetched} fetched")
-                        break
+                    url = item['link']
                     
-                    items = data['items']
-                    total_fetched += len(items)
+                    # Skip duplicates (including tracking-parameter variants)
+                    canonical = _canonical_url(url)
+                    if canonical in seen_urls:
+                        continue
+                    seen_urls.add(canonical)
                     
-                    # Extract and filter URLs
-                    for item in items:
-                        if 'link' not in item:
-                            continue
-                        
-                        url = item['link']
-                        
-                        # Skip duplicates
-                        if url in seen_urls:
-                            continue
-                        seen_urls.add(url)
-                        
-                        # Filter out social/video platforms
-                        url_lower = url.lower()
-                        if any(domain in url_lower for domain in EXCLUDED_DOMAINS):
-                            filtered_count += 1
-                            logger.debug(f"Filtered social/video: {url[:60]}...")
-                            continue
-                        
-                        all_urls.append(url)
-                        
-                        # Stop if we have enough
-                        if len(all_urls) >= max_results:
-                            break
+                    # Filter out social/video platforms
+                    url_lower = url.lower()
+                    if any(domain in url_lower for domain in EXCLUDED_DOMAINS):
+                        filtered_count += 1
+                        logger.debug("Filtered social/video: {}...", url[:60])
+                        continue
                     
-                    # Stop if Google returned fewer results than requested
-                    if len(items) < params['num']:
-                        logger.debug(f"Google returned {len(items)} < {params['num']} requested, stopping pagination")
-                        break
-                
-                # Summary logging
-                logger.info(
-                    f"Google API: Fetched {total_fetched} results, "
-                    f"filtered {filtered_count} social/video, "
-                    f"returning {len(all_urls)} article URLs"
-                )
-                
-                return all_urls
+                    all_urls.append(url)
                 
+                # Stop if Google returned a short page (no more results)
+                if len(items) < 10:
+                    logger.debug(f"Google returned {len(items)} < 10 results on page {page + 1}, stopping")
+                    break
+            
+            # Pages are fetched whole, so trim any overshoot
+            all_urls = all_urls[:max_results]
+            
+            # Summary logging
+            logger.info(
+                f"Google API: Fetched {total_fetched} results, "
+                f"filtered {filtered_count} social/video, "
+                f"returning {len(all_urls)} article URLs"
+            )
+            
+            return all_urls
+            
         except Exception as e:
             logger.error(f"Unexpected error in Google API fetch: {type(e).__name__}: {e}")
             return []
     
+    @staticmethod
+    def _google_pages_available(first_page: Optional[Dict[str, Any]], num_requests: int) -> int:
+        """
+        Number of result pages worth requesting, judged from page 1.
+        
+        Args:
+            first_page: Decoded first page, or None if it failed
+            num_requests: Pages needed for the requested result count
+        
+        Returns:
+            Pages to fetch in total, including page 1
+        """
+        if not first_page or len(first_page.get('items') or []) < 10:
+            return 1
+        if 'nextPage' not in (first_page.get('queries') or {}):
+            return 1
+        try:
+            total_results = int(first_page['searchInformation']['totalResults'])
+        except (KeyError, TypeError, ValueError):
+            return num_requests
+        return max(1, min(num_requests, (total_results + 9) // 10))
+    
     async def scrape_search_results(
         self,
         source_config: SourceConfig,
@@ -526,6 +915,8 @@ class ScraperManager:
             List of ArticleContent objects
         """
         articles = []
+        if cancellation_check:
+            cancellation_check = _Throttled(cancellation_check, self.CANCEL_POLL_INTERVAL)
         
         # Determine effective limits with priority: param > source config > global settings
         # 1. Get global defaults
@@ -596,7 +987,7 @@ class ScraperManager:
                     logger.warning(f"No search URL template for {source_config.name}")
                     return articles
                 
-                search_url = source_config.search_url_template.format(query=query)
+                search_url = _build_search_url(source_config.search_url_template, query)
                 
                 # Prepare request data if POST method is configured
                 request_method = getattr(source_config, 'request_method', 'GET')
@@ -632,7 +1023,15 @@ class ScraperManager:
                 link_selector = source_config.selectors.get('article_links', 'a')
                 logger.debug(f"Using link selector: {link_selector}")
                 
-                article_links = self.content_extractor.extract_links(html, link_selector)
+                # Parsing the search page is CPU-bound; run it in a worker thread
+                # so fetches for other sources keep progressing meanwhile
+                article_links = await asyncio.get_running_loop().run_in_executor(
+                    None, self.content_extractor.extract_links, html, link_selector
+                )
+                
+                # Search pages often list the same article several times
+                # (tracking variants, repeated cards); fetch each once
+                article_links = _dedupe_urls(article_links)
                 
                 # Limit links to max_search_results
                 article_links = article_links[:effective_max_search_results]
@@ -643,42 +1042,89 @@ class ScraperManager:
                 else:
                     logger.warning(f"No links found with selector: {link_selector}")
             
-            # Scrape articles (up to max_articles_to_process)
-            # Note: We continue trying articles until we get max_articles_to_process successful scrapes
+            # Scrape articles concurrently (up to self.concurrency at a time)
+            # Note: We keep trying articles until we get max_articles_to_process
+            # successful scrapes, then cancel whatever is still pending. Near
+            # the target fewer fetches are started, so little work is thrown away
             scraped_count = 0
             failed_count = 0
-            attempted_count = 0
+            # Per-article outcomes, logged once in the source summary
+            scrape_events = []
+            started = time.monotonic()
             
-            for idx, link in enumerate(article_links, 1):
-                attempted_count = idx  # Track last attempted index
+            if article_links and effective_max_articles > 0:
+                total_links = len(article_links)
+                remaining_links = iter(enumerate(article_links, 1))
                 
-                # Check cancellation before each article
-                if cancellation_check and cancellation_check():
-                    logger.info(f"[CANCELLED] Scraping cancelled at article {idx}/{len(article_links)} (scraped: {scraped_count}, failed: {failed_count})")
-                    return articles
-                
-                # Stop if we have enough successful scrapes
-                if scraped_count >= effective_max_articles:
-                    logger.info(f"[SCRAPING] Reached target of {effective_max_articles} articles, stopping")
-                    break
+                async def scrape_one(idx: int, link: str):
+                    if cancellation_check and cancellation_check():
+                        return idx, None
+                    logger.debug("[SCRAPING] Fetching article {}/{} from {}: {}...", idx, total_links, source_config.name, link[:80])
+                    fetch_started = time.monotonic()
+                    article = await self.scrape_article(link, source_config)
+                    scrape_events.append({
+                        'idx': idx,
+                        'url': link,
+                        'ok': article is not None,
+                        'duration_ms': round((time.monotonic() - fetch_started) * 1000)
+                    })
+                    return idx, article
                 
-                logger.info(f"[SCRAPING] Fetching article {idx}/{len(article_links)} from {source_config.name}: {link[:80]}...")
+                def start_fetches():
+                    """Top up in-flight fetches to what is still needed."""
+                    wanted = min(self.concurrency, (effective_max_articles - scraped_count) * self.OVERFETCH_RATIO)
+                    while len(pending) < wanted:
+                        next_link = next(remaining_links, None)
+                        if next_link is None:
+                            break
+                        pending.add(asyncio.ensure_future(scrape_one(*next_link)))
                 
-                article = await self.scrape_article(link, source_config)
+                pending = set()
+                scraped = []
+                try:
+                    start_fetches()
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            idx, article = task.result()
+                            if article and scraped_count >= effective_max_articles:
+                                # Finished alongside the article that hit the target
+                                continue
+                            if article:
+                                scraped.append((idx, article))
+                                scraped_count += 1
+                                logger.debug("[SCRAPING] Successfully scraped article {} from {} ({}/{})", idx, source_config.name, scraped_count, effective_max_articles)
+                            else:
+                                failed_count += 1
+                                # logger.warning(f"[SCRAPING] Failed to scrape article {idx} from {source_config.name} (failures: {failed_count})")
+                        
+                        # Stop if we have enough successful scrapes
+                        if scraped_count >= effective_max_articles:
+                            logger.info(f"[SCRAPING] Reached target of {effective_max_articles} articles, stopping")
+                            break
+                        
+                        if cancellation_check and cancellation_check():
+                            logger.info(f"[CANCELLED] Scraping cancelled after {scraped_count + failed_count}/{total_links} articles (scraped: {scraped_count}, failed: {failed_count})")
+                            break
+                        
+                        start_fetches()
+                finally:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
                 
-                if article:
-                    articles.append(article)
-                    scraped_count += 1
-                    logger.info(f"[SCRAPING] Successfully scraped article {idx} from {source_config.name} ({scraped_count}/{effective_max_articles})")
-                else:
-                    failed_count += 1
-                    # logger.warning(f"[SCRAPING] Failed to scrape article {idx} from {source_config.name} (failures: {failed_count})")
+                # Keep search-result order regardless of completion order
+                scraped.sort(key=lambda item: item[0])
+                articles = [article for _, article in scraped]
             
+            attempted_count = scraped_count + failed_count
             if attempted_count > 0:
                 logger.info(
                     f"Scraped {scraped_count} articles from {source_config.name} "
-                    f"(attempted: {attempted_count}, failed: {failed_count})"
+                    f"(attempted: {attempted_count}, failed: {failed_count}) "
+                    f"in {time.monotonic() - started:.1f}s"
                 )
+                logger.debug("[SCRAPING] {} article results: {}", source_config.name, scrape_events)
             else:
                 logger.warning(f"No articles to scrape from {source_config.name}")
             
@@ -692,46 +1138,65 @@ class ScraperManager:
         sources: List[SourceConfig],
         query: str,
         max_search_results: Optional[int] = None,
-        max_articles_to_process: Optional[int] = None
+        max_articles_to_process: Optional[int] = None,
+        max_concurrent_sources: int = 5
     ) -> List[ArticleContent]:
         """
-        Scrape articles from multiple sources.
+        Scrape articles from multiple sources concurrently.
         
         Args:
             sources: List of source configurations
             query: Search query
             max_search_results: Global override for max search results (optional)
             max_articles_to_process: Global override for max articles to process (optional)
+            max_concurrent_sources: Maximum sources scraped at once
         
         Returns:
-            Combined list of ArticleContent objects
+            Combined list of ArticleContent objects, in source order
         """
         all_articles = []
         
         logger.info(f"Starting scraping from {len(sources)} sources for query: '{query}'")
         
+        enabled_sources = []
         for source in sources:
             if not source.enabled:
                 logger.debug(f"Skipping disabled source: {source.name}")
                 continue
-            
-            try:
-                articles = await self.scrape_search_results(
+            enabled_sources.append(source)
+        
+        semaphore = asyncio.Semaphore(max_concurrent_sources)
+        
+        async def scrape_one(source: SourceConfig) -> List[ArticleContent]:
+            async with semaphore:
+                return await self.scrape_search_results(
                     source,
                     query,
                     max_search_results,
                     max_articles_to_process
                 )
-                all_articles.extend(articles)
-                logger.info(f"Got {len(articles)} articles from {source.name}")
-                
-            except Exception as e:
-                logger.error(f"Error scraping {source.name}: {e}")
+        
+        results = await asyncio.gather(
+            *(scrape_one(source) for source in enabled_sources),
+            return_exceptions=True
+        )
+        
+        seen_urls = set()
+        for source, result in zip(enabled_sources, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping {source.name}: {result}")
                 continue
+            logger.info(f"Got {len(result)} articles from {source.name}")
+            # The same article can come back from several sources
+            for article in result:
+                canonical = _canonical_url(article.url)
+                if canonical not in seen_urls:
+                    seen_urls.add(canonical)
+                    all_articles.append(article)
         
         logger.info(f"Total articles scraped: {len(all_articles)}")
         return all_articles
 
 
 # Global scraper manager instance
-scraper_manager = ScraperManager()
+scraper_manager = ScraperManager(concurrency=settings.scraper_max_concurrency)
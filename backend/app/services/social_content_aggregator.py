@@ -31,7 +31,7 @@ class SocialContentAggregator:
         # In-memory cache (in production, use Redis)
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._analysis_cache: Dict[str, Dict[str, Any]] = {}  # Cache for AI analysis results
-        self.cache_duration_hours = settings.cache_social_content_hours if hasattr(settings, 'cache_social_content_hours') else 24
+        self.cache_duration_hours = settings.cache_social_content_hours
         
     def _get_cache_key(self, url: str, platform: str) -> str:
         """Generate cache key from URL and platform."""
@@ -318,6 +318,10 @@ class SocialContentAggregator:
             analysis_count = len(self._analysis_cache)
             self._analysis_cache.clear()
             logger.info(f"Cleared all {analysis_count} cached analysis entries")
+    
+    async def aclose(self):
+        """Release pooled HTTP connections held by the platform services."""
+        await self.google_service.aclose()
 
 
 # Global instance
@@ -58,6 +58,7 @@ class Settings(BaseSettings):
     scraper_retry_delay: int = 2
     scraper_user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     scraper_respect_robots: bool = False  # Set to True for production to respect robots.txt
+    scraper_max_concurrency: int = 8  # Articles fetched at once per source
     
     # Rate Limiting
     rate_limit_requests: int = 10
@@ -126,6 +127,7 @@ class Settings(BaseSettings):
     twitter_scraper: str = "NATIVE"   # Options: NATIVE or SCRAPECREATORS
     facebook_scraper: str = "NATIVE"  # Options: NATIVE or SCRAPECREATORS
     instagram_scraper: str = "NATIVE" # Options: NATIVE or SCRAPECREATORS
+    scrapecreators_include_raw: bool = False  # Attach the full API payload as raw_data (debugging)
     
     @property
     def cors_origins_list(self) -> List[str]:
@@ -0,0 +1,30 @@
+"""
+JSON decoding helpers for HTTP API responses.
+"""
+
+from typing import Any
+import httpx
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def response_json(response: httpx.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    orjson parses the raw bytes directly and is several times faster than
+    the stdlib decoder behind httpx's response.json().
+
+    Args:
+        response: httpx response with a JSON body
+
+    Returns:
+        Decoded JSON value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
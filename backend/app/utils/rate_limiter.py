@@ -2,49 +2,121 @@
 Rate limiter utility for controlling request frequency to different domains.
 """
 
+import asyncio
 import time
-from typing import Dict
-from asyncio import Lock
+from collections import deque
+from typing import Deque, Dict
 from loguru import logger
 
 
+class TokenBucket:
+    """
+    Token bucket allowing bursts of up to capacity requests at an average rate.
+    
+    Callers reserve their token immediately (the balance may go negative) and
+    then sleep off the debt, so concurrent callers are spaced out in arrival
+    order without holding a lock across the sleep.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    def _refill(self):
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    async def acquire(self, cost: float = 1.0) -> float:
+        """
+        Take cost tokens, waiting until they have accrued.
+        
+        Args:
+            cost: Tokens to take
+        
+        Returns:
+            Seconds waited
+        """
+        self._refill()
+        self._tokens -= cost
+        wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+    
+    def defer(self, delay: float):
+        """
+        Hold off the next acquire for at least delay seconds.
+        
+        Args:
+            delay: Seconds before a token is available again
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -delay * self.rate)
+
+
 class RateLimiter:
     """
     Per-domain rate limiter to prevent overwhelming web servers.
+    
+    Each domain gets a token bucket: up to burst requests go out back to
+    back, after which requests are spaced min_delay apart on average.
     """
     
     def __init__(self):
         """Initialize the rate limiter."""
         self._last_request_time: Dict[str, float] = {}
-        self._locks: Dict[str, Lock] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
     
-    def _get_lock(self, domain: str) -> Lock:
-        """Get or create a lock for the specified domain."""
-        if domain not in self._locks:
-            self._locks[domain] = Lock()
-        return self._locks[domain]
+    def _get_bucket(self, domain: str, min_delay: float, burst: int) -> TokenBucket:
+        """Get or create the bucket for the domain, applying the current limits."""
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = TokenBucket(1.0 / min_delay, burst)
+        else:
+            bucket.rate = 1.0 / min_delay
+            bucket.capacity = burst
+        return bucket
     
-    async def wait_if_needed(self, domain: str, min_delay: float = 1.0):
+    async def wait_if_needed(self, domain: str, min_delay: float = 1.0, burst: int = 1):
         """
         Wait if necessary to respect rate limit for the domain.
         
         Args:
             domain: Domain name (e.g., 'bbc.com')
-            min_delay: Minimum seconds between requests to this domain
+            min_delay: Minimum average seconds between requests to this domain
+            burst: Requests allowed back to back before spacing applies
+        """
+        if min_delay > 0:
+            wait_time = await self._get_bucket(domain, min_delay, burst).acquire()
+            if wait_time > 0:
+                logger.debug(f"Rate limiting {domain}: waited {wait_time:.2f}s")
+        
+        self._last_request_time[domain] = time.time()
+    
+    def defer(self, domain: str, delay: float):
         """
-        lock = self._get_lock(domain)
+        Push back the next request to a domain, e.g. after a 429 Retry-After.
         
-        async with lock:
-            current_time = time.time()
-            last_time = self._last_request_time.get(domain, 0)
-            time_since_last = current_time - last_time
-            
-            if time_since_last < min_delay:
-                wait_time = min_delay - time_since_last
-                logger.debug(f"Rate limiting {domain}: waiting {wait_time:.2f}s")
-                time.sleep(wait_time)  # Using sync sleep as we're in async lock
-            
-            self._last_request_time[domain] = time.time()
+        Args:
+            domain: Domain name (e.g., 'bbc.com')
+            delay: Seconds to hold off before the domain's normal rate limit applies
+        """
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = TokenBucket(1.0)
+        bucket.defer(delay)
+        logger.debug(f"Deferring requests to {domain} by {delay:.2f}s")
     
     def reset(self, domain: str = None):
         """
@@ -55,9 +127,11 @@ class RateLimiter:
         """
         if domain:
             self._last_request_time.pop(domain, None)
+            self._buckets.pop(domain, None)
             logger.debug(f"Reset rate limiter for {domain}")
         else:
             self._last_request_time.clear()
+            self._buckets.clear()
             logger.debug("Reset rate limiter for all domains")
     
     def get_stats(self) -> Dict[str, float]:
@@ -70,5 +144,100 @@ class RateLimiter:
         return self._last_request_time.copy()
 
 
+class AIMDLimiter:
+    """
+    Concurrency limit tuned by additive-increase / multiplicative-decrease.
+
+    Each fast success raises the limit by increase/limit (about +increase per
+    window of requests); an overload signal (429, timeout, transport error)
+    multiplies it by decrease. Waiters are plain futures created on the
+    running loop, so an instance can be built at import time.
+    """
+
+    # A success counts as fast if its latency is within this multiple of the
+    # running average latency
+    LATENCY_TOLERANCE = 2.0
+
+    def __init__(self, initial: int = 8, min_limit: int = 1, max_limit: int = 16,
+                 increase: float = 0.5, decrease: float = 0.5, smoothing: float = 0.2):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            increase: Additive increase per window of fast successes
+            decrease: Multiplicative factor applied on overload
+            smoothing: Weight of the newest sample in the latency average
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.smoothing = smoothing
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._avg_latency = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return max(self.min_limit, int(self._limit))
+
+    async def acquire(self):
+        """Wait for a free slot."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; pass it on
+                self._in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, latency: float, overloaded: bool = False):
+        """
+        Free a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Seconds the call took
+            overloaded: True if upstream signalled overload (429, timeout, ...)
+        """
+        self._in_flight -= 1
+
+        if overloaded:
+            self._limit = max(float(self.min_limit), self._limit * self.decrease)
+            logger.debug(f"Upstream overloaded, concurrency limit reduced to {self.limit}")
+        else:
+            fast = (
+                self._avg_latency == 0.0
+                or latency <= self._avg_latency * self.LATENCY_TOLERANCE
+            )
+            if self._avg_latency == 0.0:
+                self._avg_latency = latency
+            else:
+                self._avg_latency += self.smoothing * (latency - self._avg_latency)
+            if fast:
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+
+        self._wake()
+
+    def _wake(self):
+        """Hand free slots to waiting callers in FIFO order."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
 # Global rate limiter instance
 rate_limiter = RateLimiter()
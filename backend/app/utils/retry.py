@@ -0,0 +1,114 @@
+"""
+Retry utility with exponential backoff and jitter for transient network failures.
+"""
+
+import asyncio
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+import httpx
+from loguru import logger
+
+T = TypeVar("T")
+
+# Status codes worth retrying: request timeout, too early, rate limiting and
+# server-side failures
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def is_transient_http_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception is a transient HTTP failure worth retrying.
+
+    Args:
+        exc: Exception raised by the wrapped call
+
+    Returns:
+        True for transport errors (timeouts, connection resets) and
+        408/425/429/5xx status errors
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """
+    Read the delay requested by a Retry-After header on a status error.
+    
+    Args:
+        exc: Exception raised by the wrapped call
+    
+    Returns:
+        Seconds to wait, or None if absent or not in delta-seconds form
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0,
+                  max_jitter: float = 0.5) -> float:
+    """
+    Compute the sleep before the next attempt.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base_delay: Delay after the first failure in seconds
+        max_delay: Upper bound for the exponential part in seconds
+        max_jitter: Maximum random seconds added to spread out retries
+
+    Returns:
+        Seconds to wait
+    """
+    return min(base_delay * (2 ** attempt), max_delay) + random.random() * max_jitter
+
+
+async def retry_async(
+    func: Callable[[], Awaitable[T]],
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    max_jitter: float = 0.5,
+    is_retryable: Callable[[BaseException], bool] = is_transient_http_error
+) -> T:
+    """
+    Await func(), retrying transient failures with exponential backoff and jitter.
+
+    Args:
+        func: Zero-argument callable returning a fresh awaitable per attempt
+        max_retries: Retries after the first attempt
+        base_delay: Delay after the first failure in seconds
+        max_delay: Upper bound for the exponential part in seconds
+        max_jitter: Maximum random seconds added to each delay
+        is_retryable: Predicate deciding whether an exception is transient
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        The last exception if it is not retryable or retries are exhausted
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await func()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay, max_jitter)
+            retry_after = retry_after_seconds(e)
+            if retry_after is not None:
+                # Honor the server's hint, within the same upper bound
+                delay = min(max(delay, retry_after), max_delay)
+            logger.warning(
+                f"Transient error (attempt {attempt + 1}/{max_retries + 1}): {e}. "
+                f"Retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
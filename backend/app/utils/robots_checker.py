@@ -2,11 +2,12 @@
 Robots.txt checker utility for ensuring compliance with website policies.
 """
 
+import asyncio
+import time
 import urllib.robotparser
 from urllib.parse import urlparse
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from loguru import logger
-from datetime import datetime, timedelta
 
 
 class RobotsChecker:
@@ -15,6 +16,9 @@ class RobotsChecker:
     Caches robots.txt files to minimize requests.
     """
     
+    # Failed fetches are cached as allow-all, but retried much sooner
+    FAILURE_CACHE_DURATION = 300  # seconds
+    
     def __init__(self, user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36", cache_duration: int = 3600):
         """
         Initialize the robots.txt checker.
@@ -25,7 +29,10 @@ class RobotsChecker:
         """
         self.user_agent = user_agent
         self.cache_duration = cache_duration
-        self._cache: Dict[str, tuple[urllib.robotparser.RobotFileParser, datetime]] = {}
+        # domain -> (parser, crawl delay, expires_at on the monotonic clock)
+        self._cache: Dict[str, Tuple[urllib.robotparser.RobotFileParser, Optional[float], float]] = {}
+        # domain -> robots.txt fetch running in the executor for check_async
+        self._pending: Dict[str, asyncio.Future] = {}
     
     def _get_robots_url(self, url: str) -> str:
         """Get the robots.txt URL for a given website URL."""
@@ -37,24 +44,26 @@ class RobotsChecker:
         parsed = urlparse(url)
         return parsed.netloc
     
-    def _get_parser(self, url: str) -> Optional[urllib.robotparser.RobotFileParser]:
+    def _get_entry(self, url: str) -> Tuple[urllib.robotparser.RobotFileParser, Optional[float], float]:
         """
-        Get robots.txt parser for the domain, using cache if available.
+        Get the cached robots.txt entry for the domain, fetching it if needed.
+        
+        The crawl delay is read once per fetched robots.txt and stored with
+        the parser, since it does not depend on the URL path.
         
         Args:
-            url: URL to get parser for
+            url: URL to get the entry for
         
         Returns:
-            RobotFileParser or None if robots.txt cannot be fetched
+            Tuple of (parser, crawl delay or None, expiry time)
         """
         domain = self._get_domain(url)
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         # Check cache
-        if domain in self._cache:
-            parser, cached_time = self._cache[domain]
-            if current_time - cached_time < timedelta(seconds=self.cache_duration):
-                return parser
+        entry = self._cache.get(domain)
+        if entry is not None and current_time < entry[2]:
+            return entry
         
         # Fetch new robots.txt
         robots_url = self._get_robots_url(url)
@@ -63,15 +72,32 @@ class RobotsChecker:
         
         try:
             parser.read()
-            self._cache[domain] = (parser, current_time)
+            try:
+                crawl_delay = parser.crawl_delay(self.user_agent)
+            except Exception:
+                crawl_delay = None
+            entry = (parser, crawl_delay, current_time + self.cache_duration)
             logger.debug(f"Fetched and cached robots.txt from {robots_url}")
-            return parser
         except Exception as e:
             logger.warning(f"Could not fetch robots.txt from {robots_url}: {e}")
             # Cache a permissive parser to avoid repeated failures
             parser.allow_all = True
-            self._cache[domain] = (parser, current_time)
-            return parser
+            entry = (parser, None, current_time + self.FAILURE_CACHE_DURATION)
+        
+        self._cache[domain] = entry
+        return entry
+    
+    def _get_parser(self, url: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        """
+        Get robots.txt parser for the domain, using cache if available.
+        
+        Args:
+            url: URL to get parser for
+        
+        Returns:
+            RobotFileParser or None if robots.txt cannot be fetched
+        """
+        return self._get_entry(url)[0]
     
     def can_fetch(self, url: str) -> bool:
         """
@@ -98,6 +124,51 @@ class RobotsChecker:
         
         return allowed
     
+    def check(self, url: str) -> Tuple[bool, Optional[float]]:
+        """
+        Check permission and crawl delay for a URL with one cache lookup.
+        
+        Args:
+            url: URL to check
+        
+        Returns:
+            Tuple of (fetching allowed, crawl delay in seconds or None)
+        """
+        parser, crawl_delay, _ = self._get_entry(url)
+        return parser.can_fetch(self.user_agent, url), crawl_delay
+    
+    async def check_async(self, url: str) -> Tuple[bool, Optional[float]]:
+        """
+        Async version of check() that keeps robots.txt downloads off the event loop.
+        
+        Cached domains are answered inline. On a miss the blocking fetch runs
+        in the default executor, and concurrent callers for the same domain
+        share that one fetch.
+        
+        Args:
+            url: URL to check
+        
+        Returns:
+            Tuple of (fetching allowed, crawl delay in seconds or None)
+        """
+        domain = self._get_domain(url)
+        entry = self._cache.get(domain)
+        if entry is None or time.monotonic() >= entry[2]:
+            loop = asyncio.get_running_loop()
+            pending = self._pending.get(domain)
+            if pending is None or pending.get_loop() is not loop:
+                pending = loop.run_in_executor(None, self._get_entry, url)
+                self._pending[domain] = pending
+                
+                def forget(done: asyncio.Future):
+                    if self._pending.get(domain) is done:
+                        del self._pending[domain]
+                
+                pending.add_done_callback(forget)
+            # Shield so one cancelled caller does not cancel the shared fetch
+            entry = await asyncio.shield(pending)
+        return entry[0].can_fetch(self.user_agent, url), entry[1]
+    
     def get_crawl_delay(self, url: str) -> Optional[float]:
         """
         Get the crawl delay specified in robots.txt for this domain.
@@ -108,17 +179,10 @@ class RobotsChecker:
         Returns:
             Crawl delay in seconds, or None if not specified
         """
-        parser = self._get_parser(url)
-        if parser is None:
-            return None
-        
-        try:
-            delay = parser.crawl_delay(self.user_agent)
-            if delay:
-                logger.debug(f"robots.txt specifies crawl delay of {delay}s for {self._get_domain(url)}")
-            return delay
-        except Exception:
-            return None
+        delay = self._get_entry(url)[1]
+        if delay:
+            logger.debug(f"robots.txt specifies crawl delay of {delay}s for {self._get_domain(url)}")
+        return delay
     
     def clear_cache(self, domain: Optional[str] = None):
         """
@@ -0,0 +1,105 @@
+"""
+Unit tests for query matching and ranking.
+"""
+
+import random
+from datetime import datetime
+from difflib import SequenceMatcher
+from unittest.mock import patch
+
+from app.models import EventData, EventType, Location, SearchQuery
+from app.services.query_matcher import QueryMatcher, _ratio_scorer
+
+
+def _event(title: str, confidence: float = 0.9) -> EventData:
+    """Build a protest event in Mumbai with the given title."""
+    return EventData(
+        event_type=EventType.PROTEST,
+        title=title,
+        summary="Crowds gathered in the city center",
+        location=Location(city="Mumbai", country="India"),
+        confidence=confidence
+    )
+
+
+class TestMatchEvents:
+    """Test batch matching and ranking."""
+
+    def test_scores_match_single_event_scoring(self):
+        """Batch scores equal calculate_relevance_score for each event."""
+        matcher = QueryMatcher()
+        query = SearchQuery(phrase="protest in Mumbai", location="Mumbai")
+        events = [_event("Mumbai protest"), _event("Cricket final", 0.5), _event("Protest march")]
+
+        matched = matcher.match_events(events, query, min_score=0.0)
+
+        assert len(matched) == len(events)
+        for match in matched:
+            expected = matcher.calculate_relevance_score(query, match['event'])
+            assert abs(match['relevance_score'] - expected) < 1e-9
+
+    def test_top_k_returns_highest_scores_in_order(self):
+        """top_k keeps only the best events, sorted descending."""
+        matcher = QueryMatcher()
+        query = SearchQuery(phrase="protest in Mumbai")
+        events = [_event(f"Protest {i}", confidence=0.1 * i) for i in range(1, 10)]
+
+        full = matcher.match_events(events, query, min_score=0.0)
+        top = matcher.match_events(events, query, min_score=0.0, top_k=3)
+
+        assert [m['event'] for m in top] == [m['event'] for m in full[:3]]
+        assert top[0]['relevance_score'] >= top[1]['relevance_score'] >= top[2]['relevance_score']
+
+
+class TestFilters:
+    """Test event filters."""
+
+    def test_filter_by_date_range_bounds(self):
+        """Dates on a bound are kept; undated and out-of-range events are not."""
+        matcher = QueryMatcher()
+        events = [_event(f"Protest {day}") for day in (1, 5, 10, 20)]
+        for event, day in zip(events, (1, 5, 10, 20)):
+            event.event_date = datetime(2024, 1, day)
+        undated = _event("Protest undated")
+        events.append(undated)
+
+        assert matcher.filter_by_date_range(events, datetime(2024, 1, 5), datetime(2024, 1, 10)) == events[1:3]
+        assert matcher.filter_by_date_range(events, date_from=datetime(2024, 1, 10)) == events[2:4]
+        assert matcher.filter_by_date_range(events, date_to=datetime(2024, 1, 5)) == events[:2]
+        assert matcher.filter_by_date_range(events) == events
+
+
+class TestRelevanceScore:
+    """Test single-event relevance scoring."""
+
+    def test_min_score_short_circuits_unreachable_events(self):
+        """Events that cannot reach min_score score 0.0 without text matching."""
+        matcher = QueryMatcher()
+        query = SearchQuery(phrase="protest in Mumbai", event_type=EventType.ATTACK)
+        event = _event("Mumbai protest", confidence=0.5)
+
+        full = matcher.calculate_relevance_score(query, event)
+        assert 0.0 < full < 0.4
+
+        with patch.object(matcher, 'calculate_text_similarity') as mock_text:
+            assert matcher.calculate_relevance_score(query, event, min_score=0.4) == 0.0
+            mock_text.assert_not_called()
+
+        assert matcher.calculate_relevance_score(query, event, min_score=full) == full
+
+
+class TestRatioScorer:
+    """Test the reusable similarity scorer."""
+
+    @patch('app.services.query_matcher.RAPIDFUZZ_AVAILABLE', False)
+    def test_difflib_fallback_matches_sequence_matcher(self):
+        """The fallback scores equal SequenceMatcher(None, query, text).ratio()."""
+        rng = random.Random(7)
+        alphabet = "abcde "
+        for _ in range(200):
+            query = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            ratio = _ratio_scorer(query)
+            for _ in range(5):
+                # Long texts exercise difflib's autojunk heuristic
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 400)))
+                assert ratio(text) == SequenceMatcher(None, query, text).ratio()
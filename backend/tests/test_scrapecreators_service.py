@@ -0,0 +1,222 @@
+"""
+Unit tests for the ScrapeCreators API client.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from app.services.scrapecreators_service import ScrapeCreatorsService, _platform_of
+
+
+def _service(handler) -> ScrapeCreatorsService:
+    """Build a service whose pooled client is served by handler."""
+    service = ScrapeCreatorsService()
+    service.api_key = "test-key"
+    service._http = httpx.AsyncClient(
+        base_url=service.base_url,
+        headers={"x-api-key": service.api_key},
+        transport=httpx.MockTransport(handler)
+    )
+    return service
+
+
+class TestGetJson:
+    """Test the shared request helper."""
+
+    def test_success_returns_decoded_body(self):
+        """A 200 response is decoded and the API key header is sent."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"description": "hello"})
+
+        service = _service(handler)
+        data = asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook"))
+
+        assert data == {"description": "hello"}
+        assert seen[0].url.path == "/v1/facebook/post"
+        assert seen[0].url.params["url"] == "u"
+        assert seen[0].headers["x-api-key"] == "test-key"
+
+    def test_auth_error_returns_none(self):
+        """401/402 responses are reported as None."""
+        service = _service(lambda request: httpx.Response(402, json={"error": "credits"}))
+        assert asyncio.run(service._get_json("/v1/twitter/tweet", {"url": "u"}, "Twitter")) is None
+
+    def test_error_body_is_not_read(self):
+        """Non-200 bodies are closed without being downloaded."""
+        chunks_read = []
+
+        class ErrorPage(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                chunks_read.append(1)
+                yield b"<html>" + b"x" * 1024 + b"</html>"
+
+        service = _service(lambda request: httpx.Response(401, stream=ErrorPage()))
+
+        assert asyncio.run(service._get_json("/v1/twitter/tweet", {"url": "u"}, "Twitter")) is None
+        assert chunks_read == []
+
+    def test_missing_api_key_skips_request(self):
+        """No request is made without an API key."""
+        seen = []
+        service = _service(lambda request: seen.append(request) or httpx.Response(200, json={}))
+        service.api_key = None
+
+        assert asyncio.run(service.get_instagram_content("https://instagram.com/p/x")) is None
+        assert seen == []
+
+
+class TestRetries:
+    """Test retrying transient upstream failures."""
+
+    @patch('app.utils.retry.backoff_delay', return_value=0)
+    def test_server_errors_are_retried(self, mock_delay):
+        """A 503 followed by a 200 returns the decoded body."""
+        responses = [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        service = _service(lambda request: responses.pop(0))
+
+        assert asyncio.run(service._get_json("/v1/instagram/post", {"url": "u"}, "Instagram")) == {"ok": True}
+        assert responses == []
+
+    def test_credit_errors_are_not_retried(self):
+        """402 is returned after a single request."""
+        seen = []
+        service = _service(lambda request: seen.append(request) or httpx.Response(402))
+
+        assert asyncio.run(service._get_json("/v1/instagram/post", {"url": "u"}, "Instagram")) is None
+        assert len(seen) == 1
+
+
+class TestResponseCache:
+    """Test caching of successful responses."""
+
+    def test_repeat_url_is_served_from_cache(self):
+        """The second fetch of a URL makes no request and returns a fresh dict."""
+        seen = []
+        service = _service(lambda request: seen.append(request) or httpx.Response(200, json={"n": [1]}))
+
+        first = asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook"))
+        first["n"].append(2)
+        second = asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook"))
+
+        assert len(seen) == 1
+        assert second == {"n": [1]}
+
+    def test_hit_keeps_payload_not_response(self):
+        """Hits are served without decoding again, and no Response is held."""
+        service = _service(lambda request: httpx.Response(200, json={"n": [1]}))
+        asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook"))
+
+        with patch('app.services.scrapecreators_service.response_json') as mock_decode:
+            assert asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook")) == {"n": [1]}
+        mock_decode.assert_not_called()
+        assert not any(
+            isinstance(part, httpx.Response) for entry in service._cache.values() for part in entry
+        )
+
+    def test_cache_is_bounded_by_total_bytes(self):
+        """The oldest payloads are evicted once body sizes exceed CACHE_MAX_BYTES."""
+        body = {"text": "x" * 100}
+        service = _service(lambda request: httpx.Response(200, json=body))
+        service.CACHE_MAX_BYTES = 300
+
+        for url in ("a", "b", "c"):
+            asyncio.run(service._get_json("/v1/facebook/post", {"url": url}, "Facebook"))
+
+        assert [key[1] for key in service._cache] == [(("url", "b"),), (("url", "c"),)]
+        assert service._cache_bytes == sum(entry[2] for entry in service._cache.values()) <= 300
+
+    def test_expired_entries_are_refetched(self):
+        """Entries older than CACHE_TTL trigger a new request."""
+        seen = []
+        service = _service(lambda request: seen.append(request) or httpx.Response(200, json={}))
+        service.CACHE_TTL = 0.0
+
+        asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook"))
+        asyncio.run(service._get_json("/v1/facebook/post", {"url": "u"}, "Facebook"))
+
+        assert len(seen) == 2
+
+
+class TestGetMany:
+    """Test concurrent multi-platform fetching."""
+
+    def test_dispatches_by_platform_in_input_order(self):
+        """Each URL goes to its platform endpoint; unsupported URLs yield None."""
+        def handler(request):
+            if request.url.path == "/v1/facebook/post":
+                return httpx.Response(200, json={"description": "fb post"})
+            return httpx.Response(500)
+
+        service = _service(handler)
+        with patch('app.utils.retry.backoff_delay', return_value=0):
+            results = asyncio.run(service.get_many([
+                "https://www.facebook.com/user/posts/1",
+                "https://example.com/article",
+                "https://x.com/user/status/2"
+            ]))
+
+        assert results[0]["platform"] == "facebook"
+        assert results[0]["text"] == "fb post"
+        assert results[1] is None
+        assert results[2] is None
+
+
+    def test_look_alike_hosts_are_not_dispatched(self):
+        """Hosts that merely contain a platform domain are unsupported."""
+        seen = []
+        service = _service(lambda request: seen.append(request) or httpx.Response(200, json={}))
+
+        results = asyncio.run(service.get_many([
+            "https://www.netflix.com/title/1",
+            "https://max.com/movies/x",
+            "https://www.dropbox.com/s/abc"
+        ]))
+
+        assert results == [None, None, None]
+        assert seen == []
+
+    def test_platform_of_matches_hosts_and_subdomains(self):
+        """Platform hosts match exactly or as a parent domain, case-insensitively."""
+        assert _platform_of("https://x.com/user/status/1") == "twitter"
+        assert _platform_of("https://mobile.Twitter.com/user/status/1") == "twitter"
+        assert _platform_of("https://m.facebook.com/story.php?id=1") == "facebook"
+        assert _platform_of("https://www.instagram.com/p/abc/") == "instagram"
+        assert _platform_of("https://example.com/?next=https://x.com/a") is None
+        assert _platform_of("https://notx.com/a") is None
+
+
+class TestFormatting:
+    """Test response formatting helpers."""
+
+    def test_parse_twitter_timestamp(self):
+        """Twitter created_at strings convert to ISO 8601 with offset."""
+        service = ScrapeCreatorsService()
+        assert service._parse_twitter_timestamp("Thu Feb 23 14:52:10 +0000 2023") == "2023-02-23T14:52:10+00:00"
+        assert service._parse_twitter_timestamp("Mon Jan 02 03:04:05 +0530 2023") == "2023-01-02T03:04:05+05:30"
+        assert service._parse_twitter_timestamp("not a timestamp") is None
+
+    def test_format_instagram_handles_missing_nested_keys(self):
+        """Missing or null nested sections fall back to empty values."""
+        service = ScrapeCreatorsService()
+        data = {"data": {"xdt_shortcode_media": {
+            "display_url": "https://img",
+            "edge_media_to_caption": {"edges": [{"node": {"text": "caption"}}]},
+            "edge_media_preview_like": {"count": 5},
+            "edge_media_to_parent_comment": None,
+            "owner": {"username": "someone"},
+            "taken_at_timestamp": 1677163930
+        }}}
+
+        formatted = service._format_instagram_content(data, "https://instagram.com/p/abc")
+
+        assert "error" not in formatted
+        assert formatted["text"] == "caption"
+        assert formatted["media"] == [{"type": "image", "url": "https://img"}]
+        assert formatted["metrics"] == {"likes": 5, "comments": 0, "views": 0}
+        assert formatted["author"]["followers"] == 0
+        assert formatted["timestamp"] == "2023-02-23T14:52:10+00:00"
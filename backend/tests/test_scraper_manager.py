@@ -0,0 +1,449 @@
+"""
+Unit tests for the scraper manager.
+"""
+
+import asyncio
+from unittest.mock import patch
+from urllib.parse import urljoin, urlparse
+
+import httpx
+from loguru import logger
+
+from app.models import ArticleContent, SourceConfig
+from app.services.scraper_manager import (
+    BROTLI_AVAILABLE, ScraperManager, _Throttled, _absolute_url, _dedupe_urls, _domain_of,
+    _printable_ratio
+)
+
+HTML = "<html><body>" + "Readable article text. " * 20 + "</body></html>"
+
+
+def _manager(handler) -> ScraperManager:
+    """Build a manager whose pooled client is served by handler."""
+    manager = ScraperManager(timeout=5.0)
+    manager._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return manager
+
+
+def _source(**kwargs) -> SourceConfig:
+    """Build an HTML search source."""
+    return SourceConfig(
+        name="Example",
+        base_url="https://news.example.com",
+        search_url_template="https://news.example.com/search?q={query}",
+        **kwargs
+    )
+
+
+def _fetch(manager: ScraperManager, url: str, **kwargs):
+    """Fetch a URL without robots.txt checks, rate limiting or jitter."""
+    with patch('app.services.scraper_manager.random.uniform', return_value=0):
+        return asyncio.run(manager.fetch_url(url, rate_limit=0, respect_robots=False, **kwargs))
+
+
+class TestFetchUrl:
+    """Test fetching pages through the pooled client."""
+
+    def test_html_page_is_returned(self):
+        """A text/html 200 response is returned as text."""
+        manager = _manager(lambda request: httpx.Response(200, html=HTML))
+        assert _fetch(manager, "https://news.example.com/a") == HTML
+
+    def test_error_and_binary_responses_return_none(self):
+        """HTTP errors and non-text content types yield None."""
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404, html="not found")
+            return httpx.Response(200, content=b"\x89PNG", headers={"content-type": "image/png"})
+
+        manager = _manager(handler)
+        assert _fetch(manager, "https://news.example.com/missing") is None
+        assert _fetch(manager, "https://news.example.com/logo.png") is None
+
+    def test_declared_charset_is_used(self):
+        """Bodies are decoded with the charset from Content-Type."""
+        body = HTML.replace("article", "caf\u00e9")
+        manager = _manager(lambda request: httpx.Response(
+            200, content=body.encode("latin-1"), headers={"content-type": "text/html; charset=iso-8859-1"}
+        ))
+        assert _fetch(manager, "https://news.example.com/a") == body
+
+    def test_misdeclared_charset_is_redetected(self):
+        """Text that decodes to control characters is re-detected from the raw bytes."""
+        manager = _manager(lambda request: httpx.Response(
+            200, content=HTML.encode(), headers={"content-type": "text/html; charset=cp037"}
+        ))
+        assert _fetch(manager, "https://news.example.com/a") == HTML
+
+    def test_oversized_body_is_truncated(self):
+        """Bodies beyond MAX_RESPONSE_BYTES are cut off at the cap."""
+        manager = _manager(lambda request: httpx.Response(200, html=HTML))
+        manager.MAX_RESPONSE_BYTES = 200
+        assert _fetch(manager, "https://news.example.com/a") == HTML[:200]
+
+    def test_retry_after_defers_domain(self):
+        """A 429 with Retry-After pushes back the domain's next request."""
+        manager = _manager(lambda request: httpx.Response(429, headers={"Retry-After": "12"}))
+
+        with patch('app.services.scraper_manager.rate_limiter.defer') as mock_defer:
+            assert _fetch(manager, "https://news.example.com/busy") is None
+        mock_defer.assert_called_once_with("news.example.com", 12.0)
+
+    def test_only_transient_statuses_defer_domain(self):
+        """A bare 429 backs the domain off; a 404 with Retry-After does not."""
+        def handler(request):
+            if request.url.path == "/gone":
+                return httpx.Response(404, headers={"Retry-After": "60"})
+            return httpx.Response(429)
+
+        manager = _manager(handler)
+        with patch('app.services.scraper_manager.rate_limiter.defer') as mock_defer, \
+                patch('app.services.scraper_manager.backoff_delay', return_value=1.5):
+            assert _fetch(manager, "https://news.example.com/gone") is None
+            assert _fetch(manager, "https://news.example.com/busy") is None
+        mock_defer.assert_called_once_with("news.example.com", 1.5)
+
+    def test_client_is_reused_until_closed(self):
+        """Fetches share one client; aclose releases it."""
+        manager = ScraperManager()
+        client = manager._get_http()
+
+        assert manager._get_http() is client
+        asyncio.run(manager.aclose())
+        assert client.is_closed
+        assert manager._http is None
+
+    def test_warmup_resolves_each_host_once(self):
+        """Known hosts are resolved once each; lookup failures are skipped."""
+        looked_up = []
+
+        def fake_getaddrinfo(host, *args):
+            looked_up.append(host)
+            if host == "down.example.com":
+                raise OSError("no such host")
+            return []
+
+        manager = ScraperManager(known_hosts=["a.example.com", "down.example.com", "a.example.com"])
+        with patch('app.services.scraper_manager.socket.getaddrinfo', fake_getaddrinfo):
+            assert asyncio.run(manager.warmup()) == 1
+        assert sorted(looked_up) == ["a.example.com", "down.example.com"]
+
+
+class TestHeaders:
+    """Test request header construction."""
+
+    def test_user_agent_rotates_and_defaults_are_not_mutated(self):
+        """Each request gets the next User-Agent; POSTs send only the User-Agent."""
+        manager = ScraperManager()
+        first = manager._merge_headers({'Accept-Language': 'fr'})
+        second = manager._merge_headers()
+        post = manager._merge_headers(skip_referer=True, minimal=True)
+
+        assert first['User-Agent'] == ScraperManager.USER_AGENTS[0]
+        assert first['Accept-Language'] == 'fr'
+        assert first['Referer'] == 'https://www.google.com/'
+        assert second['User-Agent'] == ScraperManager.USER_AGENTS[1]
+        assert second['Accept-Language'] == ScraperManager.DEFAULT_HEADERS['Accept-Language'] == 'en-US,en;q=0.9'
+        assert post == {'User-Agent': ScraperManager.USER_AGENTS[2]}
+
+    def test_brotli_only_advertised_when_decodable(self):
+        """'br' is requested only if httpx can decode it."""
+        accept_encoding = ScraperManager.DEFAULT_HEADERS['Accept-Encoding']
+        assert ('br' in accept_encoding) == BROTLI_AVAILABLE
+
+
+class TestDomainOf:
+    """Test the cached domain extractor."""
+
+    def test_matches_urlparse_netloc(self):
+        """Sliced domains equal urlparse's netloc, including edge cases."""
+        urls = [
+            "https://news.example.com/a/b", "http://example.com:8080?q=1", "https://example.com#top",
+            "https://user:pw@example.com/x", "ftp://files.example.org/a", "/relative/path", "https://"
+        ]
+        for url in urls:
+            assert _domain_of(url) == urlparse(url).netloc
+
+
+class TestPrintableRatio:
+    """Test the decoded-text quality check."""
+
+    def test_matches_per_character_count(self):
+        """The fast path and the fallback agree with counting each character."""
+        texts = [
+            "Plain text\nwith lines\tand tabs " * 40,
+            "Caf\u00e9 \u65b0\u95fb \u2028 \u00a0 ok",
+            "bin\x00\x01\x02ary\x7f" * 50,
+            "\ue000 private use \U000e0001"
+        ]
+        for text in texts:
+            sample = text[:1000]
+            expected = sum(c.isprintable() or c.isspace() for c in sample) / len(sample)
+            assert _printable_ratio(text) == expected
+        assert _printable_ratio("") == 0.0
+
+
+class TestAbsoluteUrl:
+    """Test root-relative link resolution."""
+
+    def test_matches_urljoin(self):
+        """The origin fast path and urljoin fallback agree with urljoin."""
+        for base in ("https://news.example.com", "https://news.example.com/world/index.html", "http://example.com:8080/a/"):
+            for link in ("/story/1", "/story?id=2#top", "//cdn.example.com/x", "/a/../b", "/./c", "/"):
+                assert _absolute_url(base, link) == urljoin(base, link)
+
+
+class TestDedupeUrls:
+    """Test duplicate link removal."""
+
+    def test_tracking_and_fragment_variants_collapse(self):
+        """Variants differing only in tracking params, fragment or host case are dropped."""
+        urls = [
+            "https://news.example.com/story?id=7&utm_source=feed",
+            "https://News.Example.com/story?id=7#comments",
+            "https://news.example.com/story?id=7&fbclid=abc",
+            "https://news.example.com/story?id=8",
+            "https://news.example.com/other"
+        ]
+        assert _dedupe_urls(urls) == [urls[0], urls[3], urls[4]]
+
+
+class TestGoogleSearchApi:
+    """Test Google Custom Search pagination."""
+
+    def _search(self, handler, max_results):
+        """Run a Custom Search query against handler with credentials set."""
+        manager = _manager(handler)
+        with patch('app.services.scraper_manager.settings.google_cse_api_key', "key"), \
+                patch('app.services.scraper_manager.settings.google_cse_id', "cx"):
+            return asyncio.run(manager.fetch_google_search_api("query", max_results=max_results))
+
+    @staticmethod
+    def _page(start, count=10, total=1000):
+        """Build a result page body starting at the given index."""
+        return {
+            "items": [{"link": f"https://site{start + i}.com/a"} for i in range(count)],
+            "queries": {"nextPage": [{"startIndex": start + 10}]} if start + count <= total else {},
+            "searchInformation": {"totalResults": str(total)}
+        }
+
+    def test_pages_fetched_together_and_merged_in_order(self):
+        """Pages after the first are requested together; results keep page order, skip filtered links and are trimmed."""
+        starts = []
+
+        def handler(request):
+            start = int(request.url.params["start"])
+            starts.append(start)
+            body = self._page(start)
+            if start == 1:
+                body["items"][0] = {"link": "https://www.youtube.com/watch?v=1"}
+            return httpx.Response(200, json=body)
+
+        urls = self._search(handler, max_results=25)
+
+        assert starts[0] == 1
+        assert sorted(starts) == [1, 11, 21]
+        assert len(urls) == 25
+        assert urls[0] == "https://site2.com/a"
+        assert urls[-1] == "https://site26.com/a"
+
+    def test_short_first_page_makes_one_call(self):
+        """Further pages are only requested when page 1 says they exist."""
+        starts = []
+
+        def handler(request):
+            starts.append(int(request.url.params["start"]))
+            return httpx.Response(200, json=self._page(1, count=4, total=4))
+
+        assert len(self._search(handler, max_results=100)) == 4
+        assert starts == [1]
+
+    def test_total_results_limits_pages(self):
+        """Only the pages covered by totalResults are requested."""
+        starts = []
+
+        def handler(request):
+            start = int(request.url.params["start"])
+            starts.append(start)
+            return httpx.Response(200, json=self._page(start, count=10 if start == 1 else 5, total=15))
+
+        assert len(self._search(handler, max_results=100)) == 15
+        assert sorted(starts) == [1, 11]
+
+    def test_rate_limit_cancels_outstanding_pages(self):
+        """A 429 on a later page cancels the pages still in flight."""
+        finished = []
+
+        async def handler(request):
+            start = int(request.url.params["start"])
+            if start == 11:
+                return httpx.Response(429)
+            if start > 11:
+                await asyncio.sleep(1)
+            finished.append(start)
+            return httpx.Response(200, json=self._page(start))
+
+        urls = self._search(handler, max_results=50)
+
+        assert len(urls) == 10
+        assert finished == [1]
+
+
+class TestThrottled:
+    """Test cancellation-check throttling."""
+
+    def test_polls_once_per_interval_and_latches_cancel(self):
+        """Answers are reused within the interval; True is never re-polled."""
+        answers = [False, True]
+        calls = []
+        check = _Throttled(lambda: calls.append(1) or answers[len(calls) - 1], min_interval=10)
+
+        with patch('app.services.scraper_manager.time.monotonic', side_effect=[0.0, 5.0, 10.0]):
+            assert not check()
+            assert not check()
+            assert check()
+        assert check()
+        assert len(calls) == 2
+
+
+class TestScrapeSearchResults:
+    """Test concurrent article scraping for one source."""
+
+    def _run(self, manager, links, scrape_article, **kwargs):
+        """Scrape the given links with a stubbed search page and article scraper."""
+        async def fetch_url(*args, **kwargs):
+            return "<html></html>"
+
+        with patch.object(manager, 'fetch_url', fetch_url), \
+                patch.object(manager.content_extractor, 'extract_links', return_value=links), \
+                patch.object(manager, 'scrape_article', scrape_article):
+            return asyncio.run(manager.scrape_search_results(_source(), "query", **kwargs))
+
+    def test_articles_fetched_concurrently_within_limit(self):
+        """Fetches overlap up to the concurrency limit and keep link order."""
+        manager = ScraperManager(concurrency=3)
+        in_flight = []
+        peak = []
+
+        async def scrape_article(url, source_config):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01 if url.endswith("0") else 0)
+            in_flight.remove(url)
+            return ArticleContent(url=url, title=url, content="text", source_name="Example")
+
+        links = [f"https://news.example.com/{i}" for i in range(6)]
+        articles = self._run(manager, links, scrape_article, max_search_results=6, max_articles_to_process=6)
+
+        assert [a.url for a in articles] == links
+        assert max(peak) == 3
+
+    def test_stops_once_enough_articles_succeed(self):
+        """Remaining fetches are cancelled after max_articles_to_process successes."""
+        manager = ScraperManager(concurrency=2)
+        started = []
+
+        async def scrape_article(url, source_config):
+            started.append(url)
+            await asyncio.sleep(0)
+            if url.endswith("1"):
+                return None
+            return ArticleContent(url=url, title=url, content="text", source_name="Example")
+
+        links = [f"https://news.example.com/{i}" for i in range(10)]
+        articles = self._run(manager, links, scrape_article, max_search_results=10, max_articles_to_process=2)
+
+        assert len(articles) == 2
+        assert len(started) < len(links)
+
+    def test_in_flight_fetches_shrink_near_target(self):
+        """No more than OVERFETCH_RATIO fetches run per article still needed."""
+        manager = ScraperManager(concurrency=8)
+        in_flight = []
+        peak = []
+
+        async def scrape_article(url, source_config):
+            in_flight.append(url)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(url)
+            return None if url.endswith(("0", "1", "2")) else ArticleContent(
+                url=url, title=url, content="text", source_name="Example"
+            )
+
+        links = [f"https://news.example.com/{i}" for i in range(10)]
+        articles = self._run(manager, links, scrape_article, max_search_results=10, max_articles_to_process=1)
+
+        assert [a.url for a in articles] == [links[3]]
+        assert max(peak) == ScraperManager.OVERFETCH_RATIO
+
+
+class TestScrapeSources:
+    """Test scraping several sources at once."""
+
+    def test_sources_run_concurrently_and_failures_are_isolated(self):
+        """Enabled sources overlap; one failing source does not drop the others."""
+        manager = ScraperManager()
+        running = []
+        peak = []
+
+        async def scrape_search_results(source, query, *args):
+            running.append(source.name)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(source.name)
+            if source.name == "Broken":
+                raise RuntimeError("boom")
+            return [ArticleContent(url=f"https://{source.name}.com/a", title="t", content="text", source_name=source.name)]
+
+        sources = [
+            SourceConfig(name="One", base_url="https://one.com"),
+            SourceConfig(name="Broken", base_url="https://broken.com"),
+            SourceConfig(name="Off", base_url="https://off.com", enabled=False),
+            SourceConfig(name="Two", base_url="https://two.com")
+        ]
+        with patch.object(manager, 'scrape_search_results', scrape_search_results):
+            articles = asyncio.run(manager.scrape_sources(sources, "query"))
+
+        assert [a.source_name for a in articles] == ["One", "Two"]
+        assert max(peak) == 3
+
+
+class TestScrapeArticle:
+    """Test single-article scraping."""
+
+    def test_large_and_small_pages_extract_the_same(self):
+        """Pages above the offload threshold are extracted in a thread with equal results."""
+        body = "<p>" + "Protesters gathered in the main square on Monday. " * 40 + "</p>"
+        html = f"<html><head><title>Big news</title></head><body><article>{body}</article></body></html>"
+        source = _source()
+
+        async def fetch_url(*args, **kwargs):
+            return html
+
+        results = []
+        for threshold in (len(html) + 1, 0):
+            manager = ScraperManager()
+            manager.OFFLOAD_MIN_HTML_CHARS = threshold
+            with patch.object(manager, 'fetch_url', fetch_url):
+                results.append(asyncio.run(manager.scrape_article("https://news.example.com/a", source)))
+
+        assert results[0] is not None
+        assert (results[0].title, results[0].content) == (results[1].title, results[1].content)
+
+    def test_quality_ratio_not_computed_without_debug_sink(self):
+        """The readable-character scan only runs when the debug line is emitted."""
+        html = "<html><body><article><p>" + "Readable words here. " * 30 + "</p></article></body></html>"
+
+        async def fetch_url(*args, **kwargs):
+            return html
+
+        manager = ScraperManager()
+        with patch.object(manager, 'fetch_url', fetch_url), \
+                patch('app.services.scraper_manager._READABLE_RE') as mock_re:
+            logger.disable("app.services.scraper_manager")
+            try:
+                asyncio.run(manager.scrape_article("https://news.example.com/a", _source()))
+            finally:
+                logger.enable("app.services.scraper_manager")
+        mock_re.findall.assert_not_called()
@@ -0,0 +1,202 @@
+"""
+Unit tests for utility helpers.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.utils.rate_limiter import AIMDLimiter, RateLimiter, TokenBucket
+from app.utils.robots_checker import RobotsChecker
+from app.utils.retry import retry_async, is_transient_http_error, backoff_delay, retry_after_seconds
+
+
+def _status_error(status_code: int, headers=None) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError with the given status code."""
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetry:
+    """Test retry with exponential backoff."""
+
+    def test_transient_error_classification(self):
+        """Transport errors and 429/5xx are retryable, 4xx are not."""
+        assert is_transient_http_error(httpx.ConnectError("reset"))
+        assert is_transient_http_error(_status_error(503))
+        assert is_transient_http_error(_status_error(429))
+        assert not is_transient_http_error(_status_error(404))
+        assert not is_transient_http_error(ValueError("bad"))
+
+    def test_backoff_delay_is_capped(self):
+        """Delay grows exponentially up to max_delay plus jitter."""
+        assert backoff_delay(0, base_delay=1.0, max_jitter=0.0) == 1.0
+        assert backoff_delay(3, base_delay=1.0, max_jitter=0.0) == 8.0
+        assert backoff_delay(10, base_delay=1.0, max_delay=30.0, max_jitter=0.0) == 30.0
+        assert 1.0 <= backoff_delay(0, base_delay=1.0, max_jitter=0.5) <= 1.5
+
+    def test_retry_after_header(self):
+        """Numeric Retry-After values are read; missing or dated ones are not."""
+        assert retry_after_seconds(_status_error(429, {"Retry-After": "7"})) == 7.0
+        assert retry_after_seconds(_status_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) is None
+        assert retry_after_seconds(_status_error(503)) is None
+        assert retry_after_seconds(ValueError("bad")) is None
+
+    @patch('app.utils.retry.backoff_delay', return_value=0)
+    def test_retries_until_success(self, mock_delay):
+        """Transient failures are retried and the eventual result returned."""
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise httpx.ConnectError("reset")
+            return "ok"
+
+        assert asyncio.run(retry_async(flaky, max_retries=3)) == "ok"
+        assert len(attempts) == 3
+        assert mock_delay.call_count == 2
+
+    def test_non_retryable_error_raises_immediately(self):
+        """Non-transient errors propagate without retrying."""
+        attempts = []
+
+        async def broken():
+            attempts.append(1)
+            raise _status_error(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(retry_async(broken, max_retries=3))
+        assert len(attempts) == 1
+
+
+class TestRateLimiter:
+    """Test per-domain token-bucket rate limiting."""
+
+    def test_burst_then_spaced_without_blocking_loop(self):
+        """The first burst requests pass at once; later ones sleep asynchronously."""
+        limiter = RateLimiter()
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def main():
+            for _ in range(4):
+                await limiter.wait_if_needed("example.com", min_delay=2.0, burst=2)
+
+        with patch('app.utils.rate_limiter.asyncio.sleep', fake_sleep):
+            asyncio.run(main())
+
+        assert len(sleeps) == 2
+        assert sleeps[0] == pytest.approx(2.0, abs=0.05)
+        assert sleeps[1] == pytest.approx(4.0, abs=0.05)
+
+    def test_defer_only_pushes_next_request_later(self):
+        """defer holds the domain for the longest requested delay."""
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        bucket.defer(30.0)
+        bucket.defer(1.0)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        with patch('app.utils.rate_limiter.asyncio.sleep', fake_sleep):
+            asyncio.run(bucket.acquire())
+
+        assert sleeps[0] == pytest.approx(31.0, abs=0.05)
+
+
+class TestAIMDLimiter:
+    """Test adaptive concurrency limiting."""
+
+    def test_limit_adapts_to_outcomes(self):
+        """Overload halves the limit; fast successes grow it back up to the cap."""
+        limiter = AIMDLimiter(initial=8, max_limit=10)
+
+        async def call(latency, overloaded=False):
+            await limiter.acquire()
+            limiter.release(latency, overloaded)
+
+        asyncio.run(call(1.0, overloaded=True))
+        assert limiter.limit == 4
+        for _ in range(200):
+            asyncio.run(call(1.0))
+        assert limiter.limit == 10
+
+    def test_waiters_resume_when_slots_free(self):
+        """Callers beyond the limit wait and are released in order."""
+        limiter = AIMDLimiter(initial=1, max_limit=1)
+        order = []
+
+        async def worker(name):
+            await limiter.acquire()
+            order.append(name)
+            await asyncio.sleep(0)
+            limiter.release(0.01)
+
+        async def main():
+            await asyncio.gather(*(worker(i) for i in range(3)))
+
+        asyncio.run(main())
+        assert order == [0, 1, 2]
+        assert limiter._in_flight == 0
+
+
+class TestRobotsChecker:
+    """Test robots.txt caching."""
+
+    def test_rules_and_crawl_delay_fetched_once_per_domain(self):
+        """One robots.txt read serves every URL on the domain."""
+        checker = RobotsChecker(user_agent="TestBot")
+        reads = []
+
+        def fake_read(parser):
+            reads.append(parser.url)
+            parser.parse(["User-agent: *", "Disallow: /private", "Crawl-delay: 4"])
+
+        with patch('urllib.robotparser.RobotFileParser.read', fake_read):
+            assert checker.can_fetch("https://example.com/news/1")
+            assert not checker.can_fetch("https://example.com/private/2")
+            assert checker.get_crawl_delay("https://example.com/news/3") == 4
+            assert checker.check("https://example.com/private/4") == (False, 4)
+
+        assert reads == ["https://example.com/robots.txt"]
+
+    def test_async_check_shares_one_fetch_off_the_loop(self):
+        """Concurrent async checks for a domain trigger one robots.txt read in a worker thread."""
+        checker = RobotsChecker(user_agent="TestBot")
+        reads = []
+
+        def fake_read(parser):
+            reads.append(threading.current_thread())
+            parser.parse(["User-agent: *", "Disallow: /private", "Crawl-delay: 2"])
+
+        async def main():
+            return await asyncio.gather(
+                checker.check_async("https://example.com/a"),
+                checker.check_async("https://example.com/private/b")
+            )
+
+        with patch('urllib.robotparser.RobotFileParser.read', fake_read):
+            assert asyncio.run(main()) == [(True, 2), (False, 2)]
+
+        assert len(reads) == 1
+        assert reads[0] is not threading.main_thread()
+        assert checker._pending == {}
+
+    def test_failed_fetch_allows_all_with_short_ttl(self):
+        """Unreachable robots.txt permits fetching and is retried sooner."""
+        checker = RobotsChecker(cache_duration=3600)
+
+        with patch('urllib.robotparser.RobotFileParser.read', side_effect=OSError("down")), \
+                patch('app.utils.robots_checker.time.monotonic', return_value=1000.0):
+            assert checker.can_fetch("https://down.example.com/a")
+            assert checker.get_crawl_delay("https://down.example.com/a") is None
+
+        assert checker._cache["down.example.com"][2] == 1000.0 + RobotsChecker.FAILURE_CACHE_DURATION